@@ -0,0 +1,259 @@
+import os
+
+# NOTE: Has to be set before beskar creates the QApplication.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from beskar.main_pages import DarkCurrentMonitor, DarkCurrentPage, ScanThread
+from typing import Dict, Generator, Iterable, List
+from beskar.scans import ScanModel, ScanRun, StepResult
+from beskar.simulator import SimulatorSettings, simulate
+from PyQt6.QtDataVisualization import QBar3DSeries
+from beskar.acquisition import AcquisitionSettings
+from beskar.rendering import RenderScheduler
+from beskar.constants import max_render_fps
+from contextlib import contextmanager
+from beskar.graphs import BarDataBuffer
+from beskar import app, startup
+from PyQt6 import QtCore
+
+import subprocess
+import argparse
+import logging
+import pathlib
+import numpy
+import types
+import json
+import time
+import sys
+
+
+class StageTimer:
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = {}
+
+    @contextmanager
+    def time(self, stage: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        yield
+        self.durations.setdefault(stage, []).append(time.perf_counter() - start)
+
+    def extend(self, stage: str, durations: Iterable[float]):
+        self.durations.setdefault(stage, []).extend(durations)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for stage, durations in self.durations.items():
+            milliseconds = numpy.array(durations) * 1000
+            p50, p95, p99 = numpy.percentile(milliseconds, (50, 95, 99))
+            summary[stage] = {
+                'samples': len(milliseconds),
+                'mean_ms': float(milliseconds.mean()),
+                'p50_ms': float(p50),
+                'p95_ms': float(p95),
+                'p99_ms': float(p99),
+                'max_ms': float(milliseconds.max())
+            }
+        return summary
+
+
+class TimedScanModel(ScanModel):
+    def __init__(self, timer: StageTimer, parent: QtCore.QObject = None):
+        super().__init__(parent)
+
+        self.timer = timer
+
+    @QtCore.pyqtSlot(object)
+    def record(self, result: StepResult):
+        with self.timer.time('record'):
+            super().record(result)
+
+
+class BenchmarkScanPage(QtCore.QObject):
+    # NOTE: Stands in for ScanPage, whose 3D graphs need OpenGL. Everything
+    # ScanThread talks to is the real thing, only the graph is a bare series.
+    def __init__(self, main_window, timer: StageTimer):
+        super().__init__()
+
+        self.main_window = main_window
+        self.timer = timer
+
+        self.model = TimedScanModel(timer, self)
+        self.render_scheduler = RenderScheduler(self.update_bar, max_render_fps, self)
+        self.model.well_changed.connect(self.render_scheduler.schedule)
+
+        self.series = QBar3DSeries()
+        self.bar_data = BarDataBuffer()
+        self.series.dataProxy().resetArray(self.bar_data.update(numpy.zeros((8, 8))))
+
+        self.runs: List[ScanRun] = []
+        self.failures: List[str] = []
+
+    def update_bar(self, scan_number: int, row: int, column: int):
+        with self.timer.time('render'):
+            self.series.dataProxy().setItem(row, column, self.bar_data.item(
+                row, column, float(self.model.wells[scan_number].mean[row, column])
+            ))
+
+    @QtCore.pyqtSlot(int, int)
+    def set_maximum_progress(self, scan_number: int, maximum: int):
+        self.model.set_steps(scan_number, maximum)
+
+    @QtCore.pyqtSlot(object)
+    def set_step_budget(self, result: StepResult):
+        pass
+
+    @QtCore.pyqtSlot(int, object)
+    def finish_scan(self, scan_number: int, run: ScanRun):
+        self.runs.append(run)
+
+    @QtCore.pyqtSlot(int, str)
+    def fail_scan(self, scan_number: int, message: str):
+        self.failures.append(message)
+
+
+def benchmark_scans(timer: StageTimer, scans: int, triggered: bool):
+    # NOTE: The accelerated clock skips the LED cadence, so the scans
+    # finish as fast as the scanning thread and the GUI thread allow.
+    session = simulate('Benchmark', SimulatorSettings(accelerated=True))
+
+    main_window = types.SimpleNamespace(exiting=False, mocked=False, device_name='Benchmark')
+    monitor = DarkCurrentMonitor(main_window, 'Benchmark')
+    main_window.dark_current_monitor = monitor
+    main_window.dark_current_monitors = {'Benchmark': monitor}
+    monitor.start()
+    main_window.dark_current_widget = DarkCurrentPage(main_window)
+
+    page = BenchmarkScanPage(main_window, timer)
+
+    thread = ScanThread(page, 'Benchmark')
+    thread.acquisition = AcquisitionSettings()
+    thread.hardware_triggered = triggered
+
+    for _ in range(scans):
+        scan_number = page.model.add_scan()
+        page.model.begin(scan_number, 'Benchmark')
+        thread.scan_number = scan_number
+
+        page.render_scheduler.start()
+        thread.start()
+        while not thread.wait(1):
+            app.processEvents()
+        app.processEvents()
+        page.render_scheduler.stop()
+
+        if page.failures:
+            raise RuntimeError(f'Scan {scan_number + 1} failed: {page.failures[-1]}')
+
+        # NOTE: The scanning thread's own stages come from the trace it
+        # saved, the sleep between LEDs is skipped so it is left out. The
+        # acquire stage includes the simulated sampling time, which only
+        # depends on the acquisition settings.
+        trace = page.runs[-1].trace
+        for index, stage in enumerate(trace.stages):
+            if stage != 'sleep':
+                timer.extend(stage, trace.durations[:, index])
+
+    monitor.stop()
+    session.close()
+
+
+def benchmark_dark_current(timer: StageTimer, updates: int):
+    session = simulate('Benchmark', SimulatorSettings(accelerated=True))
+
+    main_window = types.SimpleNamespace(exiting=False, mocked=False)
+    main_window.dark_current_monitor = DarkCurrentMonitor(main_window, 'Benchmark')
+    main_window.dark_current_monitor.start()
+
+    page = DarkCurrentPage(main_window)
+    for _ in range(updates):
+        with timer.time('update_data'):
+            page.update_data()
+            app.processEvents()
+
+    main_window.dark_current_monitor.stop()
+    session.close()
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=pathlib.Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_summary(summary: Dict[str, Dict[str, float]]):
+    print(f"{'stage':<12}{'samples':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for stage, stats in summary.items():
+        print(
+            f"{stage:<12}{stats['samples']:>9}{stats['p50_ms']:>10.3f}"
+            f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+        )
+
+
+def compare(baseline: dict, results: dict, threshold: float) -> bool:
+    print(f"\nCompared with {baseline['commit']}:")
+    print(f"{'stage':<12}{'p50 before':>12}{'p50 after':>12}{'p95 before':>12}{'p95 after':>12}")
+    regressed = False
+    for stage, stats in results['stages'].items():
+        if stage not in baseline['stages']:
+            continue
+        before = baseline['stages'][stage]
+        flag = ''
+        if stats['p95_ms'] > before['p95_ms'] * (1 + threshold):
+            flag = '  REGRESSED'
+            regressed = True
+        print(
+            f"{stage:<12}{before['p50_ms']:>12.3f}{stats['p50_ms']:>12.3f}"
+            f"{before['p95_ms']:>12.3f}{stats['p95_ms']:>12.3f}{flag}"
+        )
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmarks the scan and dark current hot paths against a simulated SEAL kit.'
+    )
+    parser.add_argument('--scans', type=int, default=5, help='number of simulated scans')
+    parser.add_argument(
+        '--triggered',
+        action='store_true',
+        help='scan with the hardware triggered acquisition instead of the timed one'
+    )
+    parser.add_argument('--updates', type=int, default=200, help='number of dark current updates')
+    parser.add_argument('--output', type=pathlib.Path, help='save the results as JSON')
+    parser.add_argument('--compare', type=pathlib.Path, help='results JSON from another commit')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='fraction the p95 can grow by before it counts as a regression'
+    )
+    args = parser.parse_args()
+
+    startup.device_watcher.stop()
+    logging.disable(logging.INFO)
+
+    timer = StageTimer()
+    benchmark_scans(timer, args.scans, args.triggered)
+    benchmark_dark_current(timer, args.updates)
+
+    results = {'commit': current_commit(), 'stages': timer.summary()}
+
+    print(f"Beskar hot paths at {results['commit']}:")
+    print_summary(results['stages'])
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4))
+
+    if args.compare and compare(json.loads(args.compare.read_text()), results, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,16 +1,17 @@
-from sentry_sdk.integrations.logging import LoggingIntegration
+from .stopwatch import startup_time
+from .utils import BackgroundImport, get_file
 from .settings import Settings, logging_dir
 from PyQt6.QtWidgets import QApplication
 from .constants import __version__
-from .utils import get_file
 
 import sys
 import logging
 import platform
 import darkdetect
-import sentry_sdk
 import faulthandler
 
+startup_time.lap('imports')
+
 if getattr(sys, 'frozen', False):
     from .source import FrozenImporter, get_source_internet
 
@@ -37,54 +38,87 @@ sys_info = {
     'version': platform.version(),
     'theme': darkdetect.theme()
 }
-sentry_sdk.set_context('os', sys_info)
-
-sentry_sdk.set_context('app', {'app_version': __version__})
 
 def before_breadcrumbs(crumb, hint):
     if crumb['message'] == 'The following error occured:':
         return None
     return crumb
 
-sentry_sdk.init(
-    # Testing URL:
-    # 'https://2645d9e6da7f4ae684bbfc162b78267f@o921203.ingest.sentry.io/5867522',
+def init_error_reporting():
+    # NOTE: sentry_sdk is imported on a background thread once the
+    # startup dialog is showing, this only runs after it has finished.
+    from sentry_sdk.integrations.logging import LoggingIntegration
+    import sentry_sdk
+
+    sentry_sdk.set_context('os', sys_info)
+
+    sentry_sdk.set_context('app', {'app_version': __version__})
 
-    # Production URL:
-    'https://f6c12472ccb949aaa9cc7c752f8aeb9a@o921203.ingest.sentry.io/5867524',
-    environment='production' if getattr(sys, 'frozen', False) else 'development',
-    integrations=(LoggingIntegration(logging.DEBUG, None),),
-    before_breadcrumb=before_breadcrumbs,
-    default_integrations=False,
-    traces_sample_rate=1.0,
-    release=__version__
-)
+    sentry_sdk.init(
+        # Testing URL:
+        # 'https://2645d9e6da7f4ae684bbfc162b78267f@o921203.ingest.sentry.io/5867522',
 
-settings = Settings()
+        # Production URL:
+        'https://f6c12472ccb949aaa9cc7c752f8aeb9a@o921203.ingest.sentry.io/5867524',
+        environment='production' if getattr(sys, 'frozen', False) else 'development',
+        integrations=(LoggingIntegration(logging.DEBUG, None),),
+        before_breadcrumb=before_breadcrumbs,
+        default_integrations=False,
+        traces_sample_rate=1.0,
+        release=__version__
+    )
+
+settings = Settings(watch=True)
+startup_time.lap('settings')
 
 segfault_log = (logging_dir / 'faulthandler.log').open(mode='a')
 faulthandler.enable(segfault_log)
 
 app = QApplication(sys.argv)
+startup_time.lap('application')
+
+def close_sessions():
+    # NOTE: Nothing to close if a SEAL kit was never talked to.
+    if 'beskar.daq' in sys.modules:
+        sys.modules['beskar.daq'].close_sessions()
+
+app.aboutToQuit.connect(close_sessions)
 
 from .handle_errors import handle_exception
 sys.excepthook = handle_exception
+# NOTE: handle_errors pulls in popups and through it the startup dialog's
+# pages, the main window and everything it needs is imported in the background.
+startup_time.lap('interface imports')
 
 qss = get_file('main.css', 'qss', path=True).read_text()
 if getattr(sys, 'frozen', False):
     qss = qss.replace('beskar/images', 'images')
 app.setStyleSheet(qss)
+startup_time.lap('stylesheet')
 
 from .popups import StartUpPopup
 startup = StartUpPopup()
+startup_time.lap('startup dialog')
+
+error_reporting_import = BackgroundImport('sentry_sdk', 'sentry_sdk.integrations.logging')
+error_reporting_import.finished.connect(init_error_reporting)
+
+main_window_import = BackgroundImport('beskar.gui')
 
 update_thread = None
-if sys.platform == 'win32':
-    from .update import UpdateChecker, close_toasters
-    from .handle_errors import handle_exception
-
-    update_thread = UpdateChecker()
-    update_thread.raise_exception.connect(lambda tup: handle_exception(*tup))
-    update_thread.close_all_windows.connect(QApplication.closeAllWindows)
-    app.aboutToQuit.connect(close_toasters)
-    startup.rejected.connect(close_toasters)
+
+def start_background_tasks():
+    global update_thread
+
+    error_reporting_import.start()
+    main_window_import.start()
+
+    if sys.platform == 'win32':
+        from .update import UpdateChecker, close_toasters
+
+        update_thread = UpdateChecker()
+        update_thread.raise_exception.connect(lambda tup: handle_exception(*tup))
+        update_thread.close_all_windows.connect(QApplication.closeAllWindows)
+        app.aboutToQuit.connect(close_toasters)
+        startup.rejected.connect(close_toasters)
+        update_thread.start()
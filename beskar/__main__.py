@@ -1,24 +1,53 @@
-from . import app, startup, update_thread
+from . import app, startup, start_background_tasks
 from .settings import logging_dir
-from .gui import BeskarWindow
+from .stopwatch import startup_time
+from .constants import __version__
+from PyQt6.QtCore import QTimer
 from .logs import setUpLogger
+from .utils import assets
 
 import sys
 
+def finish_startup():
+    startup_time.lap('first paint')
+    startup_time.log()
+    startup_time.save(logging_dir.parent / 'startup-times.jsonl', __version__)
+
+    # NOTE: Everything the startup dialog does not need waits until it is on screen.
+    start_background_tasks()
+
 def main():
     for logger_name in map(
         lambda name: f'beskar.{name}',
-        ('gui', 'utils', 'unknown', 'update')
+        (
+            'gui',
+            'utils',
+            'animation',
+            'daq',
+            'devices',
+            'graphs',
+            'timing',
+            'simulator',
+            'exports',
+            'stopwatch',
+            'unknown',
+            'update'
+        )
     ):
         setUpLogger(logger_name, logging_dir)
 
-    if update_thread:
-        update_thread.start()
+    assets.log_build_time()
 
     startup.show()
+    startup_time.lap('show')
+
+    # NOTE: Zero timeouts only fire once the pending show and paint events are done.
+    QTimer.singleShot(0, finish_startup)
 
     if startup.exec():
-        window = BeskarWindow(startup.mocked, startup.device_name)
+        from .gui import BeskarWindow
+
+        window = BeskarWindow(startup.mocked, startup.device_name, startup.device_names)
         window.show()
         sys.exit(app.exec())
 
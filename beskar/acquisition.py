@@ -0,0 +1,54 @@
+from .constants import samples_per_LED, LED_sample_rate
+from typing import Callable, Dict, NamedTuple
+
+import numpy
+
+# NOTE: numpy.trapz was renamed to numpy.trapezoid in numpy 2.0
+trapezoid = getattr(numpy, 'trapezoid', None) or numpy.trapz
+
+trim_proportion = 0.1
+
+def reduce_max(samples: numpy.ndarray, sample_rate: float, baseline: float) -> float:
+    return samples.max() - baseline
+
+def reduce_mean(samples: numpy.ndarray, sample_rate: float, baseline: float) -> float:
+    return samples.mean() - baseline
+
+def reduce_median(samples: numpy.ndarray, sample_rate: float, baseline: float) -> float:
+    return numpy.median(samples) - baseline
+
+def reduce_trimmed_mean(samples: numpy.ndarray, sample_rate: float, baseline: float) -> float:
+    trim = int(len(samples) * trim_proportion)
+    if trim == 0:
+        return samples.mean() - baseline
+    return numpy.partition(samples, (trim, len(samples) - trim - 1))[trim:-trim].mean() - baseline
+
+def reduce_area(samples: numpy.ndarray, sample_rate: float, baseline: float) -> float:
+    # NOTE: Subtracting the baseline's area afterwards avoids allocating
+    # a baseline corrected copy of the samples. The result is in volt seconds.
+    duration = (len(samples) - 1) / sample_rate
+    return trapezoid(samples, dx=1 / sample_rate) - baseline * duration
+
+reducers: Dict[str, Callable[[numpy.ndarray, float, float], float]] = {
+    'Max': reduce_max,
+    'Mean': reduce_mean,
+    'Median': reduce_median,
+    'Trimmed Mean': reduce_trimmed_mean,
+    'Area': reduce_area
+}
+
+
+class AcquisitionSettings(NamedTuple):
+    samples: int = samples_per_LED
+    sample_rate: float = LED_sample_rate
+    reducer: str = 'Max'
+
+    @property
+    def duration(self) -> float:
+        return self.samples / self.sample_rate
+
+    def allocate(self, steps: int) -> numpy.ndarray:
+        return numpy.zeros((steps, self.samples))
+
+    def reduce(self, samples: numpy.ndarray, baseline: float) -> float:
+        return float(reducers[self.reducer](samples, self.sample_rate, baseline))
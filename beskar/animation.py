@@ -0,0 +1,77 @@
+from PyQt6 import QtCore, QtGui, QtSvg
+from typing import Tuple, Union
+from .utils import assets
+
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def render_svg(path: str, width: int, height: int, device_pixel_ratio: float) -> QtGui.QPixmap:
+    pixmap = QtGui.QPixmap(round(width * device_pixel_ratio), round(height * device_pixel_ratio))
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+    svg_renderer = QtSvg.QSvgRenderer(path)
+    svg_renderer.setAspectRatioMode(QtCore.Qt.AspectRatioMode.KeepAspectRatio)
+
+    painter = QtGui.QPainter(pixmap)
+    svg_renderer.render(painter)
+    painter.end()
+
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+@functools.lru_cache(maxsize=None)
+def frame_pixmaps(
+    folder: str,
+    width: int,
+    height: int,
+    device_pixel_ratio: float
+) -> Tuple[QtGui.QPixmap, ...]:
+    # NOTE: Each frame sequence is only ever rasterized once per size and
+    # device pixel ratio, playing it back again just reuses the pixmaps.
+    frames = tuple(
+        render_svg(str(frame), width, height, device_pixel_ratio)
+        for frame in assets.frames(folder)
+    )
+    logger.info(f'Rendered {len(frames)} frames of {folder} at {device_pixel_ratio}x.')
+    return frames
+
+
+class FrameAnimator(QtCore.QObject):
+    frame_changed = QtCore.pyqtSignal(int)
+
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, frame_count: int, interval: int, parent: QtCore.QObject = None):
+        super().__init__(parent)
+
+        self.frame_count = frame_count
+
+        self.frame: Union[int, None] = None
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.next_frame)
+
+    def is_running(self) -> bool:
+        return self.timer.isActive()
+
+    def start(self):
+        self.frame = None
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.frame = None
+
+    @QtCore.pyqtSlot()
+    def next_frame(self):
+        self.frame = 0 if self.frame is None else self.frame + 1
+        if self.frame < self.frame_count:
+            self.frame_changed.emit(self.frame)
+        else:
+            self.stop()
+            self.finished.emit()
@@ -0,0 +1,120 @@
+from typing import Dict, List, NamedTuple, Union
+from .scans import ScanRun, WellAccumulator
+from .constants import __version__
+
+import zipfile
+import pathlib
+import struct
+import numpy
+import json
+
+archive_version = 1
+
+# NOTE: Offsets into a zip local file header, see section 4.3.7 of the zip spec.
+local_header = struct.Struct('<4s5H3L2H')
+
+
+class ScanArchive(NamedTuple):
+    header: dict
+    arrays: Dict[str, numpy.ndarray]
+
+
+def save_archive(path: pathlib.Path, header: dict, arrays: Dict[str, numpy.ndarray]):
+    # NOTE: The arrays are stored uncompressed as .npy files, which keeps the
+    # archive readable with numpy.load and lets load_archive memory-map them.
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        archive.writestr('header.json', json.dumps(header, indent=4))
+        for name, array in arrays.items():
+            with archive.open(f'{name}.npy', mode='w', force_zip64=True) as file:
+                numpy.lib.format.write_array(
+                    file, numpy.ascontiguousarray(array), allow_pickle=False
+                )
+
+
+def load_archive(path: Union[str, pathlib.Path], mmap_mode: Union[str, None] = 'r') -> ScanArchive:
+    arrays = {}
+    with open(path, mode='rb') as file, zipfile.ZipFile(file) as archive:
+        header = json.loads(archive.read('header.json'))
+
+        for info in archive.infolist():
+            if not info.filename.endswith('.npy'):
+                continue
+            name = info.filename[:-len('.npy')]
+
+            if mmap_mode is None or info.compress_type != zipfile.ZIP_STORED:
+                with archive.open(info) as member:
+                    arrays[name] = numpy.lib.format.read_array(member, allow_pickle=False)
+                continue
+
+            file.seek(info.header_offset)
+            fields = local_header.unpack(file.read(local_header.size))
+            file.seek(info.header_offset + local_header.size + fields[-2] + fields[-1])
+
+            version = numpy.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = numpy.lib.format.read_array_header_2_0(file)
+
+            if numpy.prod(shape) == 0:
+                arrays[name] = numpy.zeros(shape, dtype=dtype)
+            else:
+                arrays[name] = numpy.memmap(
+                    path,
+                    dtype=dtype,
+                    mode=mmap_mode,
+                    shape=shape,
+                    order='F' if fortran_order else 'C',
+                    offset=file.tell()
+                )
+
+    return ScanArchive(header, arrays)
+
+
+def save_scan(path: pathlib.Path, scan_number: int, wells: WellAccumulator, runs: List[ScanRun]):
+    arrays = {
+        'mean': wells.mean,
+        'std': wells.std,
+        'count': wells.count,
+        'min': wells.min,
+        'max': wells.max
+    }
+
+    run_headers = []
+    for index, run in enumerate(runs):
+        arrays[f'run_{index}/raw'] = run.readings
+        arrays[f'run_{index}/led_order'] = run.trace.positions
+        arrays[f'run_{index}/timestamps'] = run.trace.started
+        arrays[f'run_{index}/stage_durations'] = run.trace.durations
+        arrays[f'run_{index}/lateness'] = run.jitter_report.lateness
+        arrays[f'run_{index}/dark_current_samples'] = run.dark_current_samples
+
+        run_headers.append({
+            'device_name': run.device_name,
+            'started': run.started,
+            'samples': run.acquisition.samples,
+            'sample_rate': run.acquisition.sample_rate,
+            'reducer': run.acquisition.reducer,
+            'hardware_triggered': run.hardware_triggered,
+            'voltage': run.voltage,
+            'applied_voltage': run.applied_voltage,
+            'voltage_offset': run.voltage_offset,
+            'offset': run.offset,
+            'dark_current': run.dark_current,
+            'stages': list(run.trace.stages),
+            'timing': run.jitter_report.summary()
+        })
+
+    header = {
+        'format': 'beskar-scan',
+        'version': archive_version,
+        'beskar_version': __version__,
+        'scan': scan_number + 1,
+        'runs': run_headers,
+        'arrays': {
+            name: {'shape': list(numpy.shape(array)), 'dtype': str(numpy.asarray(array).dtype)}
+            for name, array in arrays.items()
+        }
+    }
+
+    save_archive(path, header, arrays)
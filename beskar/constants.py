@@ -2,6 +2,36 @@ from PyQt6.QtCore import QMargins
 
 offset = 2.5 # Voltage offset for applying voltage
 
+# NOTE: Mirrors the analog input setup in legacy/get_led_data_12.m
+# the LED flasher pulls PFI0 low at the start of every LED flash.
+trigger_source = 'PFI0'
+trigger_timeout = 5 # Seconds to wait for a single LED flash
+
+# Defaults for the per scan acquisition settings
+LED_sample_rate = 1000 # Hz
+samples_per_LED = 10
+max_LED_acquisition_time = 0.4 # Seconds, must finish before the next LED
+
+# Seconds from the start of the LED flashes to the first reading,
+# from the first reading to the second, from the second to the
+# third, and between every reading after that.
+LED_cadence = (0.412, 0.492, 0.820, 0.860)
+
+max_live_graphs = 2 # 3D graphs kept alive for the scan tabs
+
+graph_types = ('3D Bars', 'Heatmap')
+
+max_render_fps = 30 # Most times a second the scan graphs are redrawn
+
+max_trace_files = 50 # Per scan timing traces kept in the traces folder
+
+settings_write_delay = 0.5 # Seconds of quiet before settings are written
+settings_watch_interval = 2 # Seconds between checks for outside edits
+
+dark_current_sample_rate = 100 # Hz
+dark_current_buffer_size = 1000 # Samples kept by the dark current monitor
+dark_current_window = 10 # Samples shown on the dark current chart
+
 help_tab_fixed_width = 275
 
 help_tab_margins = QMargins(0, 10, 10, 0)
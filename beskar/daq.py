@@ -0,0 +1,263 @@
+from typing import Callable, Dict, Generator, Literal, TypeVar, Union
+from nidaqmx.stream_readers import AnalogSingleChannelReader
+from nidaqmx.constants import AcquisitionType, Edge, TaskMode
+from nidaqmx.error_codes import DAQmxErrors
+from contextlib import contextmanager
+from nidaqmx.errors import DaqError
+from .constants import (
+    dark_current_sample_rate,
+    dark_current_buffer_size,
+    samples_per_LED,
+    LED_sample_rate,
+    trigger_source
+)
+
+import threading
+import logging
+import nidaqmx
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+device_lost_errors = {
+    DAQmxErrors.DEVICE_REMOVED.value,
+    DAQmxErrors.DEV_CANNOT_BE_ACCESSED.value,
+    DAQmxErrors.DEVICE_NOT_USABLE_UNTIL_USB_REPLUG.value,
+    DAQmxErrors.PAL_DEVICE_NOT_FOUND.value
+}
+
+sessions: Dict[str, 'SEALKitSession'] = {}
+
+
+class SEALKitSession:
+    clock: Callable[[], float] = staticmethod(time.perf_counter)
+    sleep: Callable[[float], None] = staticmethod(time.sleep)
+
+    def __init__(self, device_name: str):
+        self.device_name = device_name
+
+        self.voltage = None
+
+        self.ao_task: Union[nidaqmx.Task, None] = None
+        self.do_task: Union[nidaqmx.Task, None] = None
+        self.ai_task: Union[nidaqmx.Task, None] = None
+
+        # NOTE: The GUI thread and the scanning thread both use the
+        # session, however the three channels are independent of each other.
+        self.ao_lock = threading.RLock()
+        self.do_lock = threading.RLock()
+        self.ai_lock = threading.RLock()
+
+        # NOTE: Only opening and closing the tasks share a lock, it is never
+        # held while waiting on a channel so it can not deadlock with them.
+        self.connection_lock = threading.RLock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.ai_task is not None
+
+    def create_task(self) -> nidaqmx.Task:
+        return nidaqmx.Task()
+
+    def create_reader(self, task: nidaqmx.Task) -> AnalogSingleChannelReader:
+        return AnalogSingleChannelReader(task.in_stream)
+
+    def open(self):
+        # NOTE: Checked before locking, the AI task is only set
+        # once every task is ready so an open session needs no lock.
+        if self.is_open:
+            return
+
+        with self.connection_lock:
+            if self.is_open:
+                return
+
+            try:
+                self.ao_task = self.create_task()
+                self.ao_task.ao_channels.add_ao_voltage_chan(
+                    f'{self.device_name}/ao0', min_val=0, max_val=5
+                )
+                self.ao_task.control(TaskMode.TASK_COMMIT)
+
+                self.do_task = self.create_task()
+                self.do_task.do_channels.add_do_chan(f'{self.device_name}/port0/line0')
+                self.do_task.control(TaskMode.TASK_COMMIT)
+
+                self.ai_task = self.create_task()
+                self.ai_task.ai_channels.add_ai_voltage_chan(
+                    f'{self.device_name}/ai1', min_val=-10, max_val=10
+                )
+                self.ai_task.control(TaskMode.TASK_COMMIT)
+            except DaqError:
+                self.close()
+                raise
+
+            logger.info(f'Opened a DAQ session for {self.device_name}.')
+
+    def close(self):
+        with self.connection_lock:
+            for task in (self.ao_task, self.do_task, self.ai_task):
+                if task is not None:
+                    try:
+                        task.close()
+                    except DaqError as error:
+                        logger.warning(
+                            f'Failed to cleanly close a task for {self.device_name}.',
+                            exc_info=error
+                        )
+            self.ao_task = self.do_task = self.ai_task = None
+
+    def reconnect(self):
+        logger.warning(f'Lost connection to {self.device_name}, reconnecting.')
+        with self.connection_lock:
+            self.close()
+            self.open()
+            if self.voltage is not None:
+                self.ao_task.write(self.voltage)
+                logger.info(f'{self.voltage} has been reapplied to the SEAL kit.')
+
+    def run(self, lock: threading.RLock, operation: Callable[[], T]) -> T:
+        with lock:
+            self.open()
+            try:
+                return operation()
+            except DaqError as error:
+                if error.error_code not in device_lost_errors:
+                    raise
+                self.reconnect()
+                return operation()
+
+    def apply_voltage(self, voltage: Union[float, int]):
+        self.run(self.ao_lock, lambda: self.ao_task.write(voltage))
+        self.voltage = voltage
+
+        logger.info(f'{voltage} has been applied to the SEAL kit.')
+
+    def interact_with_LEDs(self, interaction: Literal['on', 'off', 'on&off']):
+        if interaction not in {'on', 'off', 'on&off'}:
+            raise ValueError(f"interaction must be 'on', 'off', or 'on&off', not '{interaction}'")
+
+        logger.info(f'The LEDs in the SEAL kit were turned {interaction}.')
+
+        def interact():
+            if interaction == 'on':
+                self.do_task.write(False)
+            elif interaction == 'off':
+                self.do_task.write(True)
+            elif interaction == 'on&off':
+                self.do_task.write(False)
+                self.do_task.write(True)
+
+        self.run(self.do_lock, interact)
+
+    def restore_AI_task(self, error: Union[BaseException, None]):
+        # NOTE: Failing to give AI1 back must never hide the error the task ran into.
+        try:
+            if isinstance(error, DaqError) and error.error_code in device_lost_errors:
+                # NOTE: The old tasks belong to the unplugged device, so
+                # committing them again would only ever fail.
+                self.reconnect()
+            elif self.is_open:
+                self.ai_task.control(TaskMode.TASK_COMMIT)
+        except DaqError as restore_error:
+            if error is None:
+                raise
+            logger.warning(
+                f'Failed to give AI1 back to the on demand task of {self.device_name}.',
+                exc_info=restore_error
+            )
+
+    @contextmanager
+    def exclusive_AI_task(self) -> Generator[nidaqmx.Task, None, None]:
+        with self.ai_lock:
+            # NOTE: AI1 can only belong to one task at a time, so the
+            # on demand task has to give up its reservation first.
+            self.run(self.ai_lock, lambda: self.ai_task.control(TaskMode.TASK_UNRESERVE))
+            try:
+                with self.create_task() as task:
+                    task.ai_channels.add_ai_voltage_chan(
+                        f'{self.device_name}/ai1', min_val=-10, max_val=10
+                    )
+                    yield task
+            except BaseException as error:
+                self.restore_AI_task(error)
+                raise
+            else:
+                self.restore_AI_task(None)
+
+    @contextmanager
+    def triggered_AI_task(
+        self,
+        triggers: int,
+        samples_per_trigger: int = samples_per_LED,
+        sample_rate: Union[float, int] = LED_sample_rate
+    ) -> Generator[nidaqmx.Task, None, None]:
+        # NOTE: The task is armed before this yields, so the LEDs
+        # should only be flashed once the caller has the task.
+        with self.exclusive_AI_task() as task:
+            task.timing.cfg_samp_clk_timing(
+                sample_rate,
+                sample_mode=AcquisitionType.FINITE,
+                samps_per_chan=samples_per_trigger
+            )
+            start_trigger = task.triggers.start_trigger
+            start_trigger.cfg_dig_edge_start_trig(
+                f'/{self.device_name}/{trigger_source}',
+                trigger_edge=Edge.FALLING
+            )
+            start_trigger.retriggerable = True
+            task.in_stream.input_buf_size = triggers * samples_per_trigger
+            task.start()
+
+            logger.info(
+                f'Armed a triggered acquisition on {trigger_source} for {triggers} LED flashes.'
+            )
+
+            yield task
+
+    @contextmanager
+    def finite_AI_task(
+        self,
+        samples: int = samples_per_LED,
+        sample_rate: Union[float, int] = LED_sample_rate
+    ) -> Generator[nidaqmx.Task, None, None]:
+        with self.exclusive_AI_task() as task:
+            task.timing.cfg_samp_clk_timing(
+                sample_rate,
+                sample_mode=AcquisitionType.FINITE,
+                samps_per_chan=samples
+            )
+            task.control(TaskMode.TASK_COMMIT)
+
+            yield task
+
+    @contextmanager
+    def continuous_AI_task(
+        self,
+        sample_rate: Union[float, int] = dark_current_sample_rate,
+        buffer_size: int = dark_current_buffer_size
+    ) -> Generator[nidaqmx.Task, None, None]:
+        with self.exclusive_AI_task() as task:
+            task.timing.cfg_samp_clk_timing(
+                sample_rate,
+                sample_mode=AcquisitionType.CONTINUOUS,
+                samps_per_chan=buffer_size
+            )
+            task.start()
+
+            logger.info(f'Started streaming AI1 on {self.device_name} at {sample_rate} Hz.')
+
+            yield task
+
+
+def get_session(device_name: str) -> SEALKitSession:
+    if device_name not in sessions:
+        sessions[device_name] = SEALKitSession(device_name)
+    return sessions[device_name]
+
+def close_sessions():
+    for session in sessions.values():
+        session.close()
+    logger.info('Closed all DAQ sessions.')
@@ -0,0 +1,78 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from typing import TYPE_CHECKING, List, Tuple
+
+import functools
+import threading
+import logging
+
+if TYPE_CHECKING:
+    from nidaqmx.system import System
+
+logger = logging.getLogger(__name__)
+
+# NOTE: nidaqmx is first imported here, which happens on the
+# watcher's thread while the startup dialog is already showing.
+@functools.lru_cache
+def local_system() -> 'System':
+    from nidaqmx.system import System
+
+    return System.local()
+
+def get_device_names() -> Tuple[bool, List[str]]:
+    from nidaqmx._lib import DaqNotFoundError
+
+    errors = (FileNotFoundError, DaqNotFoundError)
+    try:
+        from __main__ import PyInstallerImportError
+        errors += (PyInstallerImportError,)
+    except ImportError:
+        pass
+    try:
+        return True, list(local_system().devices.device_names)
+    except errors:
+        return False, []
+
+
+class DeviceWatcher(QThread):
+    devices_changed = pyqtSignal(list, bool)
+
+    def __init__(self, interval: float = 1):
+        super().__init__()
+
+        self.interval = interval
+
+        self.device_names: List[str] = []
+        self.has_drivers = True
+
+        self.enumerated = threading.Event()
+        self.refresh_requested = threading.Event()
+
+        self.stopping = False
+
+    def run(self):
+        while not self.stopping:
+            has_drivers, device_names = get_device_names()
+            if (
+                not self.enumerated.is_set()
+                or device_names != self.device_names
+                or has_drivers != self.has_drivers
+            ):
+                if self.enumerated.is_set():
+                    logger.info(f'The connected devices changed to {device_names}.')
+                else:
+                    logger.info(f'The following devices were detected {device_names}.')
+                self.device_names = device_names
+                self.has_drivers = has_drivers
+                self.enumerated.set()
+                self.devices_changed.emit(device_names, has_drivers)
+
+            self.refresh_requested.wait(self.interval)
+            self.refresh_requested.clear()
+
+    def refresh(self):
+        self.refresh_requested.set()
+
+    def stop(self):
+        self.stopping = True
+        self.refresh_requested.set()
+        self.wait()
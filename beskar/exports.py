@@ -0,0 +1,94 @@
+from PyQt6.QtCore import QThread, pyqtSignal
+from typing import List, NamedTuple, Union
+from .scans import ScanRun, WellAccumulator
+from .archive import save_scan
+
+import datetime
+import pathlib
+import logging
+import csv
+
+logger = logging.getLogger(__name__)
+
+
+class ExportedScan(NamedTuple):
+    scan_number: int
+    device_name: Union[str, None]
+    wells: WellAccumulator
+    runs: List[ScanRun]
+
+
+class ExportThread(QThread):
+    progress = pyqtSignal(int, int)
+
+    exported = pyqtSignal(str)
+
+    failed = pyqtSignal(str)
+
+    # NOTE: The scans are copied on the GUI thread before being handed
+    # over, so scanning can carry on while the export is being written.
+    def __init__(self, folder: pathlib.Path, scans: List[ExportedScan]):
+        super().__init__()
+
+        self.folder = folder / f'beskar-export_{datetime.datetime.now():%Y-%m-%d_%H-%M-%S}'
+
+        self.scans = scans
+
+        self.cancelled = False
+
+    def run(self):
+        try:
+            self.export()
+        except OSError as error:
+            logger.warning(f"Failed to export the scans to '{self.folder}'.", exc_info=error)
+            self.failed.emit(str(error))
+        else:
+            if self.cancelled:
+                logger.info(f"Exporting the scans to '{self.folder}' was cancelled.")
+            else:
+                logger.info(f"{len(self.scans)} scans were exported to '{self.folder}'.")
+                self.exported.emit(str(self.folder))
+
+    def export(self):
+        self.folder.mkdir(parents=True)
+
+        self.progress.emit(0, len(self.scans))
+
+        # NOTE: The combined table is written a scan at a time, so
+        # nothing but the scan being exported is ever held in memory.
+        with (self.folder / 'scans.csv').open(mode='w', newline='') as table_file:
+            table = csv.writer(table_file, csv.excel)
+            table.writerow(['scan', 'device', 'row', 'column', 'value', 'std', 'readings'])
+
+            for exported, scan in enumerate(self.scans):
+                if self.cancelled:
+                    return
+
+                name = f'scan-{scan.scan_number + 1}'
+
+                with (self.folder / f'{name}.csv').open(mode='w', newline='') as file:
+                    writer = csv.writer(file, csv.excel)
+                    writer.writerow([f'Column {num + 1}' for num in range(scan.wells.shape[1])])
+                    writer.writerows(scan.wells.mean)
+
+                save_scan(self.folder / f'{name}.npz', scan.scan_number, scan.wells, scan.runs)
+
+                std = scan.wells.std
+                for row in range(scan.wells.shape[0]):
+                    table.writerows(
+                        [
+                            scan.scan_number + 1,
+                            scan.device_name,
+                            row + 1,
+                            column + 1,
+                            scan.wells.mean[row, column],
+                            std[row, column],
+                            scan.wells.count[row, column]
+                        ]
+                        for column in range(scan.wells.shape[1])
+                    )
+
+                self.progress.emit(exported + 1, len(self.scans))
+
+    def cancel(self):
+        self.cancelled = True
@@ -0,0 +1,264 @@
+from PyQt6 import QtCore, QtWidgets, QtGui, QtDataVisualization
+from .constants import max_live_graphs, graph_types
+from typing import List, Union
+
+import itertools
+import logging
+import numpy
+
+logger = logging.getLogger(__name__)
+
+
+class BarDataBuffer:
+    def __init__(self, rows: int = 8, columns: int = 8):
+        # NOTE: PyQt hands QBarDataArray over as nested lists, so
+        # the items are made once and only their values change.
+        self.rows = [[QtDataVisualization.QBarDataItem() for _ in range(columns)] for _ in range(rows)]
+        self.items = list(itertools.chain.from_iterable(self.rows))
+
+    def update(self, values: numpy.ndarray) -> List[List[QtDataVisualization.QBarDataItem]]:
+        for item, value in zip(self.items, values.ravel().tolist()):
+            item.setValue(value)
+        return self.rows
+
+    def item(self, row: int, column: int, value: float) -> QtDataVisualization.QBarDataItem:
+        item = self.rows[row][column]
+        item.setValue(value)
+        return item
+
+
+class BarGraph:
+    def __init__(self):
+        # TODO: Figure out how to make bars matte
+
+        self.bars = QtDataVisualization.Q3DBars()
+        self.series = QtDataVisualization.QBar3DSeries()
+
+        self.bars.addSeries(self.series)
+        self.bars.rowAxis().setRange(0, 7)
+        self.bars.columnAxis().setRange(0, 7)
+        self.bars.setShadowQuality(QtDataVisualization.QAbstract3DGraph.ShadowQuality.ShadowQualityNone)
+        theme = QtDataVisualization.Q3DTheme(QtDataVisualization.Q3DTheme.Theme.ThemeEbony)
+        theme.setAmbientLightStrength(0.5)
+        theme.setBaseColors([0x73C2FB])
+        theme.setSingleHighlightColor(0xFFFFFF)
+        font = theme.font()
+        font.setBold(True)
+        theme.setFont(font)
+        self.bars.setActiveTheme(theme)
+
+        self.container = QtWidgets.QWidget.createWindowContainer(self.bars)
+
+        self.bar_data = BarDataBuffer()
+
+        self.view: Union['ScanView', None] = None
+
+    def reset(self, values: numpy.ndarray):
+        self.series.dataProxy().resetArray(self.bar_data.update(values))
+
+    def update_bar(self, row: int, column: int, value: float):
+        self.series.dataProxy().setItem(row, column, self.bar_data.item(row, column, value))
+
+    def snapshot(self) -> QtGui.QImage:
+        return self.bars.renderToImage()
+
+
+def colormap(size: int = 256) -> List[int]:
+    # NOTE: Dark blue through the 3D bar colour to white, so a
+    # heatmap reads the same way as the bars it stands in for.
+    stops = numpy.array([0.0, 0.5, 1.0])
+    colours = numpy.array([[0x10, 0x1C, 0x3A], [0x73, 0xC2, 0xFB], [0xFF, 0xFF, 0xFF]])
+    positions = numpy.linspace(0, 1, size)
+    channels = [numpy.interp(positions, stops, colours[:, channel]) for channel in range(3)]
+    return [QtGui.qRgb(int(r), int(g), int(b)) for r, g, b in zip(*channels)]
+
+
+class HeatmapGraph(QtWidgets.QWidget):
+    colour_table = colormap()
+
+    def __init__(self, rows: int = 8, columns: int = 8, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.values = numpy.zeros((rows, columns))
+
+        self.maximum = 0.0
+
+        # NOTE: One pixel per well, painting scales it up without smoothing
+        # so an update only ever has to touch a single byte of the image.
+        self.image = QtGui.QImage(columns, rows, QtGui.QImage.Format.Format_Indexed8)
+        self.image.setColorTable(self.colour_table)
+        self.image.fill(0)
+
+        self.show_labels = True
+
+        self.setMinimumSize(200, 200)
+
+        self.view: Union['ScanView', None] = None
+
+    @property
+    def container(self) -> QtWidgets.QWidget:
+        return self
+
+    def peak(self) -> float:
+        # NOTE: A NaN well is drawn as empty instead of blanking every other well.
+        return float(self.values.max(initial=0, where=numpy.isfinite(self.values)))
+
+    def index(self, value: float) -> int:
+        if self.maximum <= 0 or not numpy.isfinite(value):
+            return 0
+        return min(max(int(value / self.maximum * 255), 0), 255)
+
+    def reset(self, values: numpy.ndarray):
+        self.values[:] = values
+        self.maximum = self.peak()
+
+        for row, column in numpy.ndindex(self.values.shape):
+            self.image.setPixel(column, row, self.index(self.values[row, column]))
+
+        self.update()
+
+    def update_bar(self, row: int, column: int, value: float):
+        self.values[row, column] = value
+
+        if self.peak() != self.maximum:
+            # NOTE: A new maximum rescales every other well, including when
+            # the well that held the maximum drops back down.
+            self.reset(self.values)
+        else:
+            self.image.setPixel(column, row, self.index(value))
+            self.update(self.cell(row, column).toAlignedRect())
+
+    def grid(self) -> QtCore.QRectF:
+        side = min(self.width(), self.height())
+        return QtCore.QRectF(
+            (self.width() - side) / 2, (self.height() - side) / 2, side, side
+        )
+
+    def cell(self, row: int, column: int) -> QtCore.QRectF:
+        grid = self.grid()
+        rows, columns = self.values.shape
+        width = grid.width() / columns
+        height = grid.height() / rows
+        return QtCore.QRectF(grid.x() + column * width, grid.y() + row * height, width, height)
+
+    def paintEvent(self, paint_event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        painter.drawImage(self.grid(), self.image)
+
+        if self.show_labels:
+            font = painter.font()
+            font.setPixelSize(max(int(self.cell(0, 0).height() / 4), 6))
+            painter.setFont(font)
+            for row, column in numpy.ndindex(self.values.shape):
+                rect = self.cell(row, column)
+                if not rect.intersects(QtCore.QRectF(paint_event.rect())):
+                    continue
+                # NOTE: Dark text on the bright end of the colormap.
+                if self.index(self.values[row, column]) > 160:
+                    painter.setPen(QtGui.QColor(0, 0, 0))
+                else:
+                    painter.setPen(QtGui.QColor(255, 255, 255))
+                painter.drawText(
+                    rect,
+                    QtCore.Qt.AlignmentFlag.AlignCenter,
+                    f'{self.values[row, column]:.3g}'
+                )
+
+        painter.end()
+
+    def snapshot(self) -> QtGui.QImage:
+        return self.grab().toImage()
+
+
+class ScanView(QtWidgets.QWidget):
+    def __init__(self, graph_type: str = graph_types[0], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.graph_type = graph_type
+
+        self.graph: Union[BarGraph, HeatmapGraph, None] = None
+
+        self.snapshot = QtWidgets.QLabel()
+        self.snapshot.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.snapshot.setSizePolicy(
+            QtWidgets.QSizePolicy.Policy.Ignored,
+            QtWidgets.QSizePolicy.Policy.Ignored
+        )
+
+        self.main_layout = QtWidgets.QStackedLayout()
+        self.main_layout.addWidget(self.snapshot)
+        self.setLayout(self.main_layout)
+
+    def attach(self, graph: BarGraph):
+        graph.view = self
+        self.graph = graph
+        self.main_layout.addWidget(graph.container)
+        self.main_layout.setCurrentWidget(graph.container)
+
+    def detach(self) -> Union[BarGraph, HeatmapGraph]:
+        graph = self.graph
+
+        image = graph.snapshot()
+        if not image.isNull():
+            self.snapshot.setPixmap(QtGui.QPixmap.fromImage(image))
+
+        self.main_layout.setCurrentWidget(self.snapshot)
+        self.main_layout.removeWidget(graph.container)
+
+        graph.view = None
+        self.graph = None
+
+        return graph
+
+    def set_graph_type(self, graph_type: str):
+        if graph_type not in graph_types:
+            raise ValueError(f'{graph_type!r} is not one of {graph_types}')
+
+        if graph_type != self.graph_type:
+            self.graph_type = graph_type
+            if self.graph is not None:
+                graph = self.detach()
+                # NOTE: Bar graphs go back to the pool, heatmaps are cheap
+                # enough that each view simply makes a new one.
+                if isinstance(graph, HeatmapGraph):
+                    graph.deleteLater()
+
+
+class GraphPool:
+    def __init__(self, capacity: int = max_live_graphs):
+        if capacity < 1:
+            raise ValueError(f'capacity must be at least 1, not {capacity}')
+
+        self.capacity = capacity
+
+        # NOTE: Least recently shown first, each 3D graph holds onto its own
+        # OpenGL context so only a few are ever alive at the same time.
+        self.graphs: List[BarGraph] = []
+
+    def acquire(self, view: ScanView) -> bool:
+        if view.graph_type == 'Heatmap':
+            if view.graph is None:
+                view.attach(HeatmapGraph())
+                return True
+            return False
+
+        if view.graph is not None:
+            self.graphs.remove(view.graph)
+            self.graphs.append(view.graph)
+            return False
+
+        released = [graph for graph in self.graphs if graph.view is None]
+        if released:
+            graph = released[0]
+            self.graphs.remove(graph)
+        elif len(self.graphs) < self.capacity:
+            graph = BarGraph()
+            logger.info(f'Created 3D graph {len(self.graphs) + 1} of {self.capacity}.')
+        else:
+            graph = self.graphs.pop(0)
+            graph.view.detach()
+
+        view.attach(graph)
+        self.graphs.append(graph)
+
+        return True
@@ -1,9 +1,9 @@
-from .pages import DarkCurrentPage, ScanPage
+from .main_pages import DarkCurrentMonitor, DarkCurrentPage, ScanPage
 from PyQt6 import QtCore, QtWidgets, QtGui
-from threading import Event
+from typing import List, Union
+from .simulator import simulate
 from .utils import get_file
 from . import __version__
-from typing import Union
 
 import logging
 
@@ -13,19 +13,43 @@ logger = logging.getLogger(__name__)
 
 
 class BeskarWindow(QtWidgets.QMainWindow):
-    def __init__(self, mocked: bool, device_name: Union[str, None]):
+    def __init__(
+        self,
+        mocked: bool,
+        device_name: Union[str, None],
+        device_names: List[str] = None
+    ):
         super().__init__()
 
-        self.wait_condition = Event()
-
         self.mocked = mocked
 
         self.device_name = device_name
 
+        # NOTE: When multiple SEAL kits are being scanned at
+        # the same time, device_name is the one shown on the
+        # dark current page.
+        if self.mocked or not device_names:
+            self.device_names = [device_name]
+        else:
+            self.device_names = device_names
+
         self.exiting = False
 
+        # NOTE: Mocked mode runs the same acquisition code against a simulated SEAL kit.
+        if self.mocked:
+            simulate(self.device_name)
+
+        self.dark_current_monitors = {
+            name: DarkCurrentMonitor(self, name) for name in self.device_names
+        }
+        for monitor in self.dark_current_monitors.values():
+            monitor.start()
+        self.dark_current_monitor = self.dark_current_monitors[self.device_name]
+
         if self.mocked:
             self.setWindowTitle(f'Beskar {__version__} (Mocked Mode)')
+        elif len(self.device_names) > 1:
+            self.setWindowTitle(f'Beskar {__version__} ({len(self.device_names)} SEAL Kits)')
         else:
             self.setWindowTitle(f'Beskar {__version__}')
 
@@ -91,6 +115,8 @@ class BeskarWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, close_event: QtGui.QCloseEvent) -> None:
         self.exiting = True
+        for monitor in self.dark_current_monitors.values():
+            monitor.stop()
         super().closeEvent(close_event)
 
     @QtCore.pyqtSlot()
@@ -124,6 +150,6 @@ class BeskarWindow(QtWidgets.QMainWindow):
             )
 
     def high_dark_current(self, msg: str, title: str = 'Unusually High Dark Current'):
-        if max(self.dark_current_widget.samples) > 1:
+        if self.dark_current_widget.samples.max(initial=0) > 1:
             logger.warning('Unusually high dark current detected.')
             QtWidgets.QMessageBox.warning(self, title, msg)
@@ -1,7 +1,5 @@
-from sentry_sdk.utils import event_from_exception
 from PyQt6.QtCore import QCoreApplication
 from .popups import ErrorPopup
-from sentry_sdk import Hub
 
 import traceback
 import pathlib
@@ -9,11 +7,10 @@ import inspect
 import logging
 import sys
 
-pool = None
-if sys.platform == 'win32':
-    from .update import pool
-
 def send_error_report(exc_info, flush=True):
+    from sentry_sdk.utils import event_from_exception
+    from sentry_sdk import Hub
+
     hub = Hub.current
     if hub.client is not None:
         hub.capture_event(*event_from_exception(exc_info))
@@ -62,8 +59,8 @@ def handle_exception(exc_type, exc_value, trace):
             )
 
         logger.critical('The following error occured:', exc_info=exc_tuple)
-        if pool is not None:
-            pool.clear()
+        if 'beskar.update' in sys.modules:
+            sys.modules['beskar.update'].pool.clear()
     except Exception as second_error:
         second_error.__context__ = exc_value
         if popup.sending:
@@ -1,6 +1,11 @@
+from typing import Dict, Tuple, Union
+
 import logging, logging.handlers
+import threading
 import datetime
 import pathlib
+import atexit
+import queue
 
 # NOTE: Adapted from: https://github.com/Ahsoka/bdaybot/blob/master/bdaybot/logs.py
 
@@ -41,47 +46,119 @@ def file_renamer(filename: str):
     split = filename.split('.')
     return ".".join(split[:-3] + [split[-1], split[-2]])
 
+class RoutingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+
+        self.handlers: Dict[Tuple[pathlib.Path, Union[str, None]], logging.Handler] = {}
+
+    def add(self, destination: Tuple[pathlib.Path, Union[str, None]], handler: logging.Handler):
+        self.handlers.setdefault(destination, handler)
+
+    def emit(self, record: logging.LogRecord):
+        handler = self.handlers.get(record.destination)
+        if handler is not None:
+            handler.handle(record)
+
+    def close(self):
+        for handler in self.handlers.values():
+            handler.close()
+        super().close()
+
+
+class DestinationQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, queue: 'queue.SimpleQueue', destination: Tuple[pathlib.Path, Union[str, None]]):
+        super().__init__(queue)
+
+        self.destination = destination
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.destination = self.destination
+        return record
+
+
+# NOTE: Every logger only puts its records on this queue, the files and the
+# console are written to by the listener's thread so logging never blocks
+# the thread doing the logging (like the scan threads) on I/O.
+log_queue = queue.SimpleQueue()
+router = RoutingHandler()
+listener: Union[logging.handlers.QueueListener, None] = None
+lock = threading.Lock()
+
+def start_listener(fmt: str) -> logging.handlers.QueueListener:
+    global listener
+
+    if listener is None:
+        # Create a handler so we can see the output on the console
+        console = logging.StreamHandler()
+        console.setLevel(logging.DEBUG)
+        console.setFormatter(PrettyFormatter(fmt=fmt))
+
+        listener = logging.handlers.QueueListener(
+            log_queue, console, router, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(stop_listener)
+
+    return listener
+
+def stop_listener():
+    global listener
+
+    with lock:
+        if listener is not None:
+            # NOTE: Stopping waits for every queued record to be written.
+            listener.stop()
+            router.close()
+            listener = None
+
 def setUpLogger(
     name,
     logs_dir: pathlib.Path,
     fmt='%(levelname)s | %(name)s: [%(funcName)s()] %(message)s',
     file_name: str = None
 ):
+    if file_name is not None and not isinstance(file_name, str):
+        raise TypeError(f"{file_name} must be str type, not '{type(file_name)}'.")
+
     # Init the logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
-    # Init the PrettyFormatter
-    pretty = PrettyFormatter(fmt=fmt)
-
-    # Create a handler that records all activity
-    if isinstance(file_name, str):
-        everything = logging.FileHandler(logs_dir / file_name, encoding='UTF-8')
-    elif file_name is None:
-        everything = logging.handlers.TimedRotatingFileHandler(
-            logs_dir / f'{format(datetime.datetime.today(), "%Y-%m-%d")}.log',
-            when='midnight',
-            encoding='UTF-8'
-        )
-    else:
-        raise TypeError(f"{file_name} must be str type, not '{type(file_name)}'.")
-    # Do not use loggging.NOTSET, does not work for some reason
-    # use logging.DEBUG if you want the lowest level
-    everything.setLevel(logging.DEBUG)
-    everything.setFormatter(pretty)
+    destination = (pathlib.Path(logs_dir), file_name)
+
+    with lock:
+        start_listener(fmt)
+
+        # NOTE: Setting up the same logger again is a no-op, so handlers never stack up.
+        if any(
+            isinstance(handler, DestinationQueueHandler) and handler.destination == destination
+            for handler in logger.handlers
+        ):
+            return logger
 
-    # Rename files so .log is the file extension
-    everything.namer = file_renamer
+        if destination not in router.handlers:
+            # Create a handler that records all activity
+            if file_name is None:
+                everything = logging.handlers.TimedRotatingFileHandler(
+                    logs_dir / f'{format(datetime.datetime.today(), "%Y-%m-%d")}.log',
+                    when='midnight',
+                    encoding='UTF-8'
+                )
+            else:
+                everything = logging.FileHandler(logs_dir / file_name, encoding='UTF-8')
+            # Do not use loggging.NOTSET, does not work for some reason
+            # use logging.DEBUG if you want the lowest level
+            everything.setLevel(logging.DEBUG)
+            everything.setFormatter(PrettyFormatter(fmt=fmt))
 
-    # Add handlers to the logger
-    logger.addHandler(everything)
+            # Rename files so .log is the file extension
+            everything.namer = file_renamer
 
-    # Create a handler so we can see the output on the console
-    console = logging.StreamHandler()
-    console.setLevel(logging.DEBUG)
-    console.setFormatter(pretty)
+            router.add(destination, everything)
 
-    # Add handler to the logger
-    logger.addHandler(console)
+        # Add handlers to the logger
+        logger.addHandler(DestinationQueueHandler(log_queue, destination))
 
     return logger
@@ -0,0 +1,1139 @@
+from .constants import (
+    dark_current_sample_rate,
+    dark_current_buffer_size,
+    max_LED_acquisition_time,
+    max_render_fps,
+    max_live_graphs,
+    graph_types,
+    dark_current_window,
+    help_tab_fixed_width,
+    help_tab_margins,
+    LED_sample_rate,
+    LED_cadence,
+    samples_per_LED,
+    trigger_timeout,
+    trigger_source,
+    offset
+)
+from .utils import LED_position_gen, get_session, get_file
+from .timing import LEDStepScheduler, JitterReport, ScanTrace
+from .scans import ScanModel, ScanRun, StepResult, RingBuffer
+from PyQt6 import QtCore, QtWidgets, QtCharts, QtGui, QtTest
+from .acquisition import AcquisitionSettings, reducers
+from .exports import ExportThread, ExportedScan
+from .settings import logging_dir, traces_dir
+from .widgets import LinkHoverColorChange
+from typing import Union, List, Dict
+from .rendering import RenderScheduler
+from .graphs import GraphPool, ScanView
+from .archive import save_scan
+from .logs import setUpLogger
+from .pages import BasePage
+from . import settings
+
+import darkdetect
+import threading
+import datetime
+import itertools
+import pathlib
+import numpy
+import time
+import csv
+
+# NOTE: The main window's pages are kept apart from the startup dialog's
+# so numpy, QtCharts and QtDataVisualization are only imported once the
+# startup dialog is already on screen.
+
+logger = setUpLogger(__name__, logging_dir)
+
+
+class DarkCurrentMonitor(QtCore.QThread):
+    def __init__(
+        self,
+        main_window,
+        device_name: Union[str, None],
+        sample_rate: Union[int, float] = dark_current_sample_rate,
+        buffer_size: int = dark_current_buffer_size
+    ):
+        super().__init__()
+
+        self.main_window = main_window
+
+        self.device_name = device_name
+
+        self.sample_rate = sample_rate
+        self.chunk_size = max(1, round(sample_rate / 10))
+
+        self.buffer = RingBuffer(buffer_size)
+        self.has_samples = threading.Event()
+
+        self.idle = threading.Event()
+        self.idle.set()
+        self.streaming = threading.Lock()
+
+        self.stopping = False
+
+    def run(self):
+        # NOTE: nidaqmx is slow to import, so it is only
+        # imported once something actually talks to a SEAL kit.
+        from nidaqmx.errors import DaqError
+
+        logger.info(f'Started monitoring the dark current of {self.device_name}.')
+        while not self.stopped():
+            if not self.idle.wait(timeout=0.1):
+                continue
+            with self.streaming:
+                if not self.idle.is_set():
+                    continue
+                try:
+                    self.stream()
+                except DaqError as error:
+                    logger.warning(
+                        'Lost the dark current stream, retrying in 1 second.',
+                        exc_info=error
+                    )
+                    time.sleep(1)
+        logger.info(f'Stopped monitoring the dark current of {self.device_name}.')
+
+    def stream(self):
+        session = get_session(self.device_name)
+        with session.continuous_AI_task(self.sample_rate, self.buffer.capacity) as task:
+            while self.idle.is_set() and not self.stopped():
+                self.extend(
+                    task.read(number_of_samples_per_channel=self.chunk_size, timeout=1)
+                )
+
+    def extend(self, samples: List[float]):
+        self.buffer.extend(samples)
+        self.has_samples.set()
+
+    def stopped(self) -> bool:
+        return self.stopping or self.main_window.exiting
+
+    def stop(self):
+        self.stopping = True
+        self.wait()
+
+    def pause(self):
+        # NOTE: Blocks until AI1 has been handed back to the session.
+        self.idle.clear()
+        with self.streaming:
+            pass
+
+    def resume(self):
+        self.idle.set()
+
+    def latest(self, count: int = dark_current_window, timeout: float = 0) -> numpy.ndarray:
+        # NOTE: Never waits by default since the GUI thread calls this,
+        # until the first samples are read it is just empty.
+        if not self.has_samples.wait(timeout=timeout):
+            logger.debug('The dark current monitor has not read any samples yet.')
+        return self.buffer.latest(count)
+
+
+class DarkCurrentPage(BasePage):
+    def __init__(self, main_window):
+        with self.init(main_window):
+            self.bar = QtCharts.QBarSeries()
+            self.bar.setLabelsVisible(True)
+            self.bar.setLabelsPosition(
+                QtCharts.QAbstractBarSeries.LabelsPosition.LabelsOutsideEnd
+            )
+
+            # NOTE: The bar set is made once, refreshing only replaces its values.
+            self.bar_set = QtCharts.QBarSet('Values')
+            self.bar_set.setLabelColor(QtCore.Qt.GlobalColor.white)
+            self.bar_set.setBrush(0x73C2FB)
+            self.bar_set.setBorderColor(QtGui.QColor(0, 0, 0, 0))
+            self.bar.append(self.bar_set)
+
+            self.latest_samples = numpy.zeros(0)
+
+            self.update_data()
+
+            self.chart = QtCharts.QChart()
+            self.chart.setTheme(QtCharts.QChart.ChartTheme.ChartThemeDark)
+            self.chart.setTitle('Dark Current')
+            title_font = QtGui.QFont()
+            title_font.setPointSizeF(30)
+            title_font.setWeight(700)
+            title_font.setHintingPreference(QtGui.QFont.HintingPreference.PreferFullHinting)
+            self.chart.setTitleFont(title_font)
+            self.chart.addSeries(self.bar)
+
+            self.chart.createDefaultAxes()
+            for axis in self.chart.axes():
+                axis.setGridLineVisible(False)
+                axis.setMinorGridLineVisible(False)
+            x_axis = self.chart.axes(QtCore.Qt.Orientation.Horizontal)[0]
+            x_axis.setTitleText('Sample Number')
+
+            y_axis = self.chart.axes(QtCore.Qt.Orientation.Vertical)[0]
+            font = y_axis.titleFont()
+            font.setHintingPreference(QtGui.QFont.HintingPreference.PreferNoHinting)
+            y_axis.setTitleFont(font)
+            y_axis.setTitleText('Volts')
+
+            self.chart.legend().hide()
+            self.chart.layout().setContentsMargins(0, 0, 0, 0)
+            self.chart.setBackgroundRoundness(30)
+            self.chart.setBackgroundBrush(QtCore.Qt.GlobalColor.black)
+
+            self.set_y_axis_range()
+
+            self.chart_view = QtCharts.QChartView(self.chart)
+            self.chart_view.setObjectName('dark_current_chart_view')
+            self.chart_view.setViewportUpdateMode(
+                QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate
+            )
+            self.chart_view.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+            self.chart_view.setMinimumSize(630, 500)
+
+            self.refresh_button = QtWidgets.QPushButton('Refresh')
+            self.refresh_button.setObjectName('dark_current_refresh_button')
+            self.refresh_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.refresh_button.setFixedWidth(100)
+
+            self.chart_layout = QtWidgets.QVBoxLayout()
+            self.chart_layout.addWidget(self.chart_view)
+            self.chart_layout.setSpacing(30)
+            self.chart_layout.addWidget(self.refresh_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
+
+            self.help_tab = QtWidgets.QLabel(get_file('dark-current.md', 'desc', path=True).read_text())
+            self.help_tab.setTextFormat(QtCore.Qt.TextFormat.RichText)
+            self.help_tab.setFixedWidth(help_tab_fixed_width)
+            self.help_tab.setWordWrap(True)
+
+            self.desc_layout = QtWidgets.QVBoxLayout()
+            self.desc_layout.addWidget(self.help_tab)
+            self.desc_layout.addStretch(40)
+            self.desc_layout.setContentsMargins(help_tab_margins)
+
+            self.main_layout = QtWidgets.QHBoxLayout()
+            self.main_layout.addLayout(self.chart_layout)
+            self.main_layout.addSpacing(30)
+            self.main_layout.addLayout(self.desc_layout)
+            self.main_layout.setContentsMargins(
+                30, 30, 11, 11
+            )
+
+    def update_data(self):
+        samples = self.main_window.dark_current_monitor.latest()
+        # NOTE: Keeps showing the last readings until the monitor has new ones.
+        if len(samples):
+            self.set_samples(samples)
+
+    @QtCore.pyqtSlot(object)
+    def set_samples(self, samples: numpy.ndarray):
+        self.latest_samples = samples
+
+        if self.bar_set.count() > len(samples):
+            self.bar_set.remove(len(samples), self.bar_set.count() - len(samples))
+        for index, sample in enumerate(samples[:self.bar_set.count()].tolist()):
+            self.bar_set.replace(index, sample)
+        if self.bar_set.count() < len(samples):
+            self.bar_set.append(samples[self.bar_set.count():].tolist())
+
+        maximum = self.samples.max(initial=0)
+        if maximum > 0.9:
+            self.set_y_axis_range(maximum * 1.1)
+
+        logger.info('Updated dark current readings.')
+
+    def set_y_axis_range(self, upper: Union[float, int] = None):
+        if upper is None:
+            upper = self.samples.max(initial=0) * 1.1
+            if upper < 1:
+                upper = 1
+
+        if hasattr(self, 'chart'):
+            self.chart.axes(QtCore.Qt.Orientation.Vertical)[0].setRange(0, upper)
+
+    @property
+    def samples(self) -> numpy.ndarray:
+        return self.latest_samples
+
+    @QtCore.pyqtSlot()
+    def on_dark_current_refresh_button_clicked(self):
+        self.update_data()
+
+    def mousePressEvent(self, mouse_event: QtGui.QMouseEvent = None) -> None:
+        if self.refresh_button.hasFocus() and not self.refresh_button.underMouse():
+            self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
+        if mouse_event:
+            super().mousePressEvent(mouse_event)
+
+
+class ScanThread(QtCore.QThread):
+    update_dark_current = QtCore.pyqtSignal(object)
+
+    set_maximum_progress_bar = QtCore.pyqtSignal(int, int)
+
+    step_recorded = QtCore.pyqtSignal(object)
+
+    scan_finished = QtCore.pyqtSignal(int, object)
+
+    scan_failed = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, scan_page: 'ScanPage', device_name: Union[str, None]):
+        super().__init__()
+
+        self.scan_page = scan_page
+
+        self.device_name = device_name
+
+        self.scan_number = None
+
+        # NOTE: Every SEAL kit flashes its LEDs in its own
+        # order, so each kit needs to keep track of its own position.
+        self.led_position_gen = LED_position_gen(start_at_zero=True)
+        self.led_position = next(self.led_position_gen)
+        self.LED_step = 0
+
+        # NOTE: Where the SEAL kit was when the current scan started,
+        # so the LED position can be put right if the scan fails.
+        self.scan_start_step = 0
+        self.scan_length = 0
+        self.LEDs_flashed = False
+
+        self.hardware_triggered = False
+
+        self.acquisition = AcquisitionSettings()
+
+        self.connect_signals()
+
+    def connect_signals(self):
+        self.update_dark_current.connect(
+            self.scan_page.main_window.dark_current_widget.set_samples
+        )
+
+        self.set_maximum_progress_bar.connect(
+            self.scan_page.set_maximum_progress
+        )
+
+        self.step_recorded.connect(
+            self.scan_page.model.record
+        )
+
+        self.step_recorded.connect(
+            self.scan_page.set_step_budget
+        )
+
+        self.scan_finished.connect(
+            self.scan_page.finish_scan
+        )
+
+        self.scan_failed.connect(
+            self.scan_page.fail_scan
+        )
+
+    def run(self):
+        scan_number = self.scan_number
+
+        from nidaqmx.errors import DaqError
+
+        try:
+            self.scan(scan_number)
+        except DaqError as error:
+            # NOTE: Most likely no LED flash reached PFI0 within the trigger timeout.
+            logger.error(f'Scan {scan_number + 1} failed on {self.device_name}.', exc_info=error)
+            self.scan_failed.emit(scan_number, str(error))
+        except Exception as error:
+            # NOTE: Anything else is still reported like any other
+            # crash, the scan page just has to stop waiting on it first.
+            self.scan_failed.emit(scan_number, f'{type(error).__name__}: {error}')
+            raise
+
+    def scan(self, scan_number: int):
+        self.scan_start_step = self.LED_step
+        self.LEDs_flashed = False
+
+        logger.info(
+            f'Scan {scan_number + 1} was initiated on {self.device_name} with {self.acquisition}.'
+        )
+
+        monitor = self.scan_page.main_window.dark_current_monitors[self.device_name]
+
+        started = datetime.datetime.now()
+
+        # NOTE: The chart shows the same samples the baseline comes from,
+        # as long as this is the SEAL kit the dark current page is showing.
+        samples = monitor.latest(timeout=2)
+        if not len(samples):
+            # NOTE: Without a baseline every reading would turn into NaN.
+            logger.error(f'Scan {scan_number + 1} has no dark current to start from.')
+            self.scan_failed.emit(
+                scan_number, f'The dark current of {self.device_name} could not be read.'
+            )
+            return
+        dark_current = float(samples.mean())
+        if self.device_name == self.scan_page.main_window.device_name:
+            self.update_dark_current.emit(samples)
+
+        length = 64 if len(self.led_position) == 3 else 65
+        self.set_maximum_progress_bar.emit(scan_number, length)
+
+        self.scan_length = length
+
+        session = get_session(self.device_name)
+        trace = ScanTrace(length, clock=session.clock)
+
+        readings = self.acquisition.allocate(length)
+
+        hardware_triggered = self.hardware_triggered and not self.scan_page.main_window.mocked
+
+        monitor.pause()
+        try:
+            if hardware_triggered:
+                jitter_report = self.triggered_scan(scan_number, length, dark_current, readings, trace)
+            else:
+                jitter_report = self.timed_scan(scan_number, length, dark_current, readings, trace)
+        finally:
+            monitor.resume()
+
+        if jitter_report is None:
+            return
+
+        logger.info(f'Scan {scan_number + 1} ended.')
+        logger.info(f'Scan {scan_number + 1} timing: {jitter_report}.')
+
+        trace_path = traces_dir / (
+            f"{started:%Y-%m-%d_%H-%M-%S}_scan-{scan_number + 1}"
+            f"_{self.device_name}.csv"
+        )
+        try:
+            trace.save(trace_path)
+            logger.info(f"Scan {scan_number + 1}'s trace was saved to '{trace_path}'.")
+        except OSError as error:
+            logger.warning(f"Failed to save Scan {scan_number + 1}'s trace.", exc_info=error)
+
+        # NOTE: The run belongs to the GUI thread from here on.
+        self.scan_finished.emit(scan_number, ScanRun(
+            self.device_name,
+            started.isoformat(),
+            self.acquisition,
+            hardware_triggered,
+            session.voltage,
+            settings.get('applied-voltage'),
+            settings.get('voltage-offset'),
+            offset,
+            dark_current,
+            samples,
+            readings,
+            trace,
+            jitter_report
+        ))
+
+    def timed_scan(
+        self,
+        scan_number: int,
+        length: int,
+        dark_current: float,
+        readings: numpy.ndarray,
+        trace: ScanTrace
+    ) -> Union[JitterReport, None]:
+        session = get_session(self.device_name)
+
+        scheduler = LEDStepScheduler(length, clock=session.clock, sleep=session.sleep)
+
+        with session.finite_AI_task(self.acquisition.samples, self.acquisition.sample_rate) as task:
+            reader = session.create_reader(task)
+            session.interact_with_LEDs('on&off')
+            self.LEDs_flashed = True
+
+            scheduler.start()
+
+            for progress in range(length):
+                if self.scan_page.main_window.exiting:
+                    return None
+
+                with trace.span(progress, 'sleep'):
+                    scheduler.wait_for_step(progress)
+
+                with trace.span(progress, 'acquire'):
+                    task.start()
+                    reader.read_many_sample(
+                        readings[progress],
+                        self.acquisition.samples,
+                        timeout=trigger_timeout
+                    )
+                    task.stop()
+
+                with trace.span(progress, 'reduce'):
+                    value = self.acquisition.reduce(readings[progress], dark_current)
+
+                self.record_LED_reading(scan_number, progress, value, trace)
+
+        return scheduler.report()
+
+    def triggered_scan(
+        self,
+        scan_number: int,
+        length: int,
+        dark_current: float,
+        readings: numpy.ndarray,
+        trace: ScanTrace
+    ) -> Union[JitterReport, None]:
+        # NOTE: Each LED flash pulls PFI0 low which retriggers the
+        # acquisition, so the samples always line up with the LED that
+        # was lit no matter how late this thread gets to read them.
+        session = get_session(self.device_name)
+
+        scheduler = LEDStepScheduler(
+            length, clock=session.clock, sleep=session.sleep, hardware_triggered=True
+        )
+
+        with session.triggered_AI_task(
+            length,
+            self.acquisition.samples,
+            self.acquisition.sample_rate
+        ) as task:
+            reader = session.create_reader(task)
+            session.interact_with_LEDs('on&off')
+            self.LEDs_flashed = True
+
+            scheduler.start()
+
+            for progress in range(length):
+                if self.scan_page.main_window.exiting:
+                    return None
+                # NOTE: Waiting for the trigger counts as acquiring
+                # since that is when the SEAL kit is sampling.
+                with trace.span(progress, 'acquire'):
+                    reader.read_many_sample(
+                        readings[progress],
+                        self.acquisition.samples,
+                        timeout=trigger_timeout
+                    )
+                # NOTE: Only measures how far behind the hardware
+                # this thread is, the readings themselves are not affected.
+                scheduler.record(progress)
+
+                with trace.span(progress, 'reduce'):
+                    value = self.acquisition.reduce(readings[progress], dark_current)
+
+                self.record_LED_reading(scan_number, progress, value, trace)
+
+        return scheduler.report()
+
+    def record_LED_reading(self, scan_number: int, progress: int, value: float, trace: ScanTrace):
+        trace.set_position(progress, self.led_position)
+
+        with trace.span(progress, 'emit'):
+            self.step_recorded.emit(StepResult(
+                scan_number,
+                progress,
+                len(trace.positions),
+                self.led_position[0],
+                self.led_position[1],
+                value,
+                trace.busy(progress)
+            ))
+
+        self.led_position = next(self.led_position_gen)
+        self.LED_step += 1
+
+    def resync_LED_position(self):
+        # NOTE: Once its LEDs were flashed the SEAL kit goes through the whole
+        # sequence, otherwise it never left the position the scan started at.
+        step = self.scan_start_step
+        if self.LEDs_flashed:
+            step += self.scan_length
+
+        self.led_position_gen = LED_position_gen(start_at_zero=True)
+        self.led_position = next(itertools.islice(self.led_position_gen, step, None))
+        self.LED_step = step
+
+
+class ScanPage(BasePage):
+    def __init__(self, main_window):
+        with self.init(main_window):
+            self.model = ScanModel(self)
+            self.model.well_changed.connect(self.update_well)
+            self.model.progress_changed.connect(self.set_progress)
+
+            self.scanning: Dict[int, ScanThread] = {}
+
+            self.show_step_budget = settings.get('show-step-budget', False)
+
+            self.render_scheduler = RenderScheduler(
+                self.update_bar, settings.get('max-render-fps', max_render_fps), self
+            )
+
+            self.scan_label = QtWidgets.QLabel('Scan')
+            font = self.scan_label.font()
+            font.setHintingPreference(QtGui.QFont.HintingPreference.PreferFullHinting)
+            self.scan_label.setFont(font)
+            self.scan_label.setObjectName('scan_page_header')
+
+            # NOTE: Every scan gets a view but only the most recently shown
+            # ones hold onto a live 3D graph, the rest show a snapshot.
+            self.bar_charts: List[ScanView] = list()
+
+            self.graph_pool = GraphPool(settings.get('max-live-graphs', max_live_graphs))
+
+            self.graph_type = settings.get('graph-type', graph_types[0])
+            if self.graph_type not in graph_types:
+                self.graph_type = graph_types[0]
+
+            self.bar_charts_tab = QtWidgets.QTabWidget()
+            self.bar_charts_tab.setObjectName('bar_charts_tab')
+
+            self.create_bar_graph()
+            self.show_scan(0)
+
+            self.bar_charts_tab.addTab(QtWidgets.QWidget(), '')
+
+            self.scanning_progress_label = QtWidgets.QLabel('Scanning progress:')
+            self.scanning_progress_label.hide()
+
+            self.progress_bar = QtWidgets.QProgressBar()
+            sp_retain = self.progress_bar.sizePolicy()
+            sp_retain.setRetainSizeWhenHidden(True)
+            self.progress_bar.setSizePolicy(sp_retain)
+            self.progress_bar.hide()
+
+            self.step_budget_label = QtWidgets.QLabel()
+            self.step_budget_label.setObjectName('step_budget_label')
+            self.step_budget_label.setToolTip(
+                'Time spent on the last LED outside of waiting for it, '
+                'it has to stay well under the time between LEDs.'
+            )
+            self.step_budget_label.hide()
+
+            self.progress_bar_layout = QtWidgets.QHBoxLayout()
+            self.progress_bar_layout.addWidget(self.scanning_progress_label)
+            self.progress_bar_layout.addSpacing(10)
+            self.progress_bar_layout.addWidget(self.progress_bar)
+            self.progress_bar_layout.addSpacing(10)
+            self.progress_bar_layout.addWidget(self.step_budget_label)
+
+            self.notice_for_reading = QtWidgets.QLabel(
+                'Even though it looks like nothing is happening, <b>data is still being read!</b> '
+                "The reason you can't see anything happening on screen is because the values being "
+                'read are zeros.'
+            )
+            sp_retain = self.notice_for_reading.sizePolicy()
+            sp_retain.setVerticalPolicy(QtWidgets.QSizePolicy.Policy.Fixed)
+            sp_retain.setRetainSizeWhenHidden(True)
+            self.notice_for_reading.setSizePolicy(sp_retain)
+            self.notice_for_reading.hide()
+
+            self.start_button = QtWidgets.QPushButton('Start')
+            self.start_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.start_button.setObjectName('start_button')
+
+            self.save_button = QtWidgets.QPushButton('Save')
+            self.save_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.save_button.setObjectName('save_button')
+            self.save_button.setEnabled(False)
+            self.save_button.hide()
+
+            self.export_button = QtWidgets.QPushButton('Export All')
+            self.export_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.export_button.setObjectName('export_button')
+            self.export_button.setToolTip(
+                'Save every finished scan along with a combined table of all of them.'
+            )
+            self.export_button.hide()
+
+            self.samples_spin_box = QtWidgets.QSpinBox()
+            self.samples_spin_box.setObjectName('samples_spin_box')
+            self.samples_spin_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.samples_spin_box.setRange(1, 10000)
+            self.samples_spin_box.setValue(settings.get('samples-per-LED', samples_per_LED))
+
+            self.sample_rate_spin_box = QtWidgets.QSpinBox()
+            self.sample_rate_spin_box.setObjectName('sample_rate_spin_box')
+            self.sample_rate_spin_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.sample_rate_spin_box.setRange(10, 48000)
+            self.sample_rate_spin_box.setSuffix(' Hz')
+            self.sample_rate_spin_box.setValue(settings.get('sample-rate', LED_sample_rate))
+
+            self.reducer_combo_box = QtWidgets.QComboBox()
+            self.reducer_combo_box.setObjectName('reducer_combo_box')
+            self.reducer_combo_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.reducer_combo_box.addItems(reducers)
+            self.reducer_combo_box.setCurrentText(settings.get('reducer', 'Max'))
+
+            self.triggered_check_box = QtWidgets.QCheckBox('Hardware triggered')
+            self.triggered_check_box.setObjectName('triggered_check_box')
+            self.triggered_check_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.triggered_check_box.setChecked(settings.get('hardware-triggered-scan', False))
+            self.triggered_check_box.setToolTip(
+                f'Time each LED reading off the {trigger_source} trigger '
+                'from the SEAL kit instead of the computer clock.'
+            )
+            if self.main_window.mocked:
+                self.triggered_check_box.hide()
+
+            self.acquisition_layout = QtWidgets.QHBoxLayout()
+            self.acquisition_layout.addWidget(QtWidgets.QLabel('Samples per LED:'))
+            self.acquisition_layout.addWidget(self.samples_spin_box)
+            self.acquisition_layout.addSpacing(20)
+            self.acquisition_layout.addWidget(QtWidgets.QLabel('Sample rate:'))
+            self.acquisition_layout.addWidget(self.sample_rate_spin_box)
+            self.acquisition_layout.addSpacing(20)
+            self.acquisition_layout.addWidget(QtWidgets.QLabel('Reducer:'))
+            self.acquisition_layout.addWidget(self.reducer_combo_box)
+            self.acquisition_layout.addSpacing(20)
+            self.graph_type_combo_box = QtWidgets.QComboBox()
+            self.graph_type_combo_box.setObjectName('graph_type_combo_box')
+            self.graph_type_combo_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.graph_type_combo_box.addItems(graph_types)
+            self.graph_type_combo_box.setCurrentText(self.graph_type)
+            self.graph_type_combo_box.setToolTip(
+                'Heatmaps are much lighter to draw than 3D bars on slower graphics.'
+            )
+
+            self.all_graph_types_check_box = QtWidgets.QCheckBox('For every scan')
+            self.all_graph_types_check_box.setObjectName('all_graph_types_check_box')
+            self.all_graph_types_check_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.all_graph_types_check_box.setChecked(True)
+            self.all_graph_types_check_box.setToolTip(
+                'Change the view of every scan and use it for new ones, '
+                'otherwise only the current scan changes.'
+            )
+
+            self.acquisition_layout.addWidget(QtWidgets.QLabel('View:'))
+            self.acquisition_layout.addWidget(self.graph_type_combo_box)
+            self.acquisition_layout.addWidget(self.all_graph_types_check_box)
+            self.step_budget_check_box = QtWidgets.QCheckBox('Show step budget')
+            self.step_budget_check_box.setObjectName('step_budget_check_box')
+            self.step_budget_check_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.step_budget_check_box.setChecked(self.show_step_budget)
+
+            self.acquisition_layout.addStretch(100)
+            self.acquisition_layout.addWidget(self.step_budget_check_box)
+            self.acquisition_layout.addSpacing(20)
+            self.acquisition_layout.addWidget(self.triggered_check_box)
+
+            self.buttons_layout = QtWidgets.QHBoxLayout()
+            self.buttons_layout.setSpacing(0)
+            self.buttons_layout.addWidget(self.export_button, alignment=QtCore.Qt.AlignmentFlag.AlignLeft)
+            self.buttons_layout.addStretch(100)
+            self.buttons_layout.addWidget(self.start_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
+            self.buttons_layout.addWidget(self.save_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
+
+            self.bar_chart_layout = QtWidgets.QVBoxLayout()
+            self.bar_chart_layout.setSpacing(0)
+            self.bar_chart_layout.addWidget(self.scan_label, alignment=QtCore.Qt.AlignmentFlag.AlignHCenter)
+            self.bar_chart_layout.addWidget(self.bar_charts_tab)
+            self.bar_chart_layout.addSpacing(10)
+            self.bar_chart_layout.addLayout(self.progress_bar_layout)
+            self.bar_chart_layout.addSpacing(10)
+            self.bar_chart_layout.addWidget(self.notice_for_reading, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
+            self.bar_chart_layout.addSpacing(10)
+            self.bar_chart_layout.addLayout(self.acquisition_layout)
+            self.bar_chart_layout.addSpacing(10)
+            self.bar_chart_layout.addLayout(self.buttons_layout)
+
+            self.help_tab = LinkHoverColorChange('#0078D8', '#777777', get_file('scan.md', 'desc', path=True).read_text())
+            self.help_tab.setTextFormat(QtCore.Qt.TextFormat.RichText)
+            self.help_tab.setOpenExternalLinks(True)
+            self.help_tab.setFixedWidth(help_tab_fixed_width)
+            self.help_tab.setWordWrap(True)
+
+            self.desc_layout = QtWidgets.QVBoxLayout()
+            self.desc_layout.addWidget(self.help_tab)
+            self.desc_layout.addStretch(40)
+            self.desc_layout.setContentsMargins(help_tab_margins)
+
+            self.main_layout = QtWidgets.QHBoxLayout()
+            self.main_layout.addLayout(self.bar_chart_layout)
+            self.main_layout.addSpacing(30)
+            self.main_layout.addLayout(self.desc_layout)
+            self.main_layout.setContentsMargins(
+                30, 30, 11, 11
+            )
+
+            self.file_dialog = QtWidgets.QFileDialog(
+                self.main_window,
+                caption=f'Saving Scan',
+                filter='CSV File (*.csv);;Scan Archive (*.npz);;Screenshot (*.png)'
+            )
+            # NOTE: For some reason connectSlotsByName is not working
+            # self.file_dialog.setObjectName('file_dialog')
+            self.file_dialog.filterSelected.connect(self.on_file_dialog_filterSelected)
+            self.file_dialog.accepted.connect(self.on_file_dialog_accepted)
+            self.file_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
+
+            self.warning_screenshot_dialog = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Icon.Warning,
+                'Screenshots may not work properly',
+                'Screenshots are still in beta and may not accurately '
+                'capture the current view.',
+                QtWidgets.QMessageBox.StandardButton.Ok,
+                self.main_window
+            )
+
+            self.export_dialog = QtWidgets.QFileDialog(
+                self.main_window,
+                caption='Export All Scans'
+            )
+            self.export_dialog.setFileMode(QtWidgets.QFileDialog.FileMode.Directory)
+            self.export_dialog.setOption(QtWidgets.QFileDialog.Option.ShowDirsOnly)
+            self.export_dialog.accepted.connect(self.on_export_dialog_accepted)
+
+            self.export_thread: Union[ExportThread, None] = None
+
+            self.export_progress_dialog = QtWidgets.QProgressDialog(
+                'Exporting scans...', 'Cancel', 0, 1, self.main_window
+            )
+            self.export_progress_dialog.setWindowTitle('Export All Scans')
+            self.export_progress_dialog.setWindowModality(QtCore.Qt.WindowModality.WindowModal)
+            self.export_progress_dialog.setAutoReset(False)
+            self.export_progress_dialog.setMinimumDuration(0)
+            self.export_progress_dialog.reset()
+
+            self.scanning_threads = [
+                ScanThread(self, device_name) for device_name in self.main_window.device_names
+            ]
+
+    def create_bar_graph(self, index=0):
+        self.bar_charts.append(ScanView(self.graph_type))
+        self.model.add_scan()
+
+        self.bar_charts_tab.insertTab(
+            index,
+            self.bar_charts[len(self.bar_charts) - 1],
+            f'Scan {len(self.bar_charts)}'
+        )
+
+        logger.info(f'A new bar chart view created for Scan {len(self.bar_charts)}.')
+
+    def show_scan(self, scan_number: int):
+        if self.graph_pool.acquire(self.bar_charts[scan_number]):
+            # NOTE: A graph that was handed over from another scan
+            # still has that scan's bars, so all of them get replaced.
+            self.reset_bar_graph(scan_number)
+
+    def reset_bar_graph(self, scan_number: int):
+        # NOTE: Rebuilds every bar, only needed when a graph gets new data
+        # all at once, afterwards update_bar only touches the bar that changed.
+        graph = self.bar_charts[scan_number].graph
+        if graph is not None:
+            graph.reset(self.model.wells[scan_number].mean)
+
+    def update_bar(self, scan_number: int, row: int, column: int):
+        # NOTE: Scans without a live graph catch up in show_scan.
+        graph = self.bar_charts[scan_number].graph
+        if graph is not None:
+            graph.update_bar(row, column, float(self.model.wells[scan_number].mean[row, column]))
+
+    @QtCore.pyqtSlot(int)
+    def on_bar_charts_tab_currentChanged(self, tab: int):
+        if tab + 1 == len(self.bar_charts_tab):
+            self.create_bar_graph(tab)
+            self.bar_charts_tab.setCurrentIndex(tab)
+            return
+
+        self.show_scan(tab)
+
+        self.export_button.setVisible(bool(self.model.scanned))
+
+        self.graph_type_combo_box.blockSignals(True)
+        self.graph_type_combo_box.setCurrentText(self.bar_charts[tab].graph_type)
+        self.graph_type_combo_box.blockSignals(False)
+
+        if tab in self.scanning:
+            self.scanning_progress_label.show()
+            self.progress_bar.show()
+            self.progress_bar.setMaximum(self.model.progress[tab][1])
+            self.progress_bar.setValue(self.model.progress[tab][0])
+            self.step_budget_label.setVisible(self.show_step_budget)
+            self.start_button.hide()
+            self.save_button.show()
+            self.save_button.setEnabled(False)
+        elif tab in self.model.scanned:
+            self.start_button.hide()
+            self.save_button.show()
+            self.save_button.setEnabled(True)
+            self.notice_for_reading.hide()
+            self.step_budget_label.hide()
+        else:
+            self.progress_bar.hide()
+            self.scanning_progress_label.hide()
+            self.notice_for_reading.hide()
+            self.step_budget_label.hide()
+            self.save_button.hide()
+            self.start_button.show()
+            self.start_button.setEnabled(not self.scanning)
+
+    @QtCore.pyqtSlot()
+    def on_start_button_clicked(self):
+        if not self.scanning:
+            acquisition = AcquisitionSettings(
+                self.samples_spin_box.value(),
+                self.sample_rate_spin_box.value(),
+                self.reducer_combo_box.currentText()
+            )
+            if acquisition.duration > max_LED_acquisition_time:
+                QtWidgets.QMessageBox.warning(
+                    self.main_window,
+                    'Too Many Samples',
+                    f'Reading {acquisition.samples} samples at {acquisition.sample_rate} Hz '
+                    f'takes longer than {max_LED_acquisition_time} seconds, which would overlap '
+                    'with the next LED. Lower the number of samples or raise the sample rate.'
+                )
+                return
+
+            self.render_scheduler.start()
+
+            current_tab = self.bar_charts_tab.currentIndex()
+            for index, thread in enumerate(self.scanning_threads):
+                if index == 0:
+                    scan_number = current_tab
+                else:
+                    # NOTE: Every other SEAL kit gets a new tab of its own.
+                    scan_number = len(self.bar_charts)
+                    self.create_bar_graph(scan_number)
+                if len(self.scanning_threads) > 1:
+                    self.bar_charts_tab.setTabText(
+                        scan_number, f'Scan {scan_number + 1} ({thread.device_name})'
+                    )
+
+                self.scanning[scan_number] = thread
+                self.model.begin(scan_number, thread.device_name)
+
+                thread.scan_number = scan_number
+                thread.acquisition = acquisition
+                thread.hardware_triggered = self.triggered_check_box.isChecked()
+                thread.start()
+
+            self.on_bar_charts_tab_currentChanged(current_tab)
+
+    @QtCore.pyqtSlot(int, int, int)
+    def set_progress(self, scan_number: int, progress: int, maximum: int):
+        if self.bar_charts_tab.currentIndex() == scan_number:
+            self.progress_bar.setMaximum(maximum)
+            self.progress_bar.setValue(progress)
+
+    @QtCore.pyqtSlot(int, int)
+    def set_maximum_progress(self, scan_number: int, maximum: int):
+        self.model.set_steps(scan_number, maximum)
+
+    @QtCore.pyqtSlot(int, int, int)
+    def update_well(self, scan_number: int, row: int, column: int):
+        self.render_scheduler.schedule(scan_number, row, column)
+
+        if self.bar_charts_tab.currentIndex() == scan_number:
+            if self.model.wells[scan_number].last_values_zero():
+                logger.debug('The last four values read from the SEAL kit have been zeros.')
+                self.notice_for_reading.show()
+            else:
+                self.notice_for_reading.hide()
+
+    @QtCore.pyqtSlot(object)
+    def set_step_budget(self, result: StepResult):
+        if self.show_step_budget and self.bar_charts_tab.currentIndex() == result.scan_number:
+            self.step_budget_label.setText(
+                f'Step {result.step + 1}/{result.steps}: {result.busy * 1000:.1f} ms '
+                f'of {LED_cadence[-1] * 1000:.0f} ms'
+            )
+
+    @QtCore.pyqtSlot(int, object)
+    def finish_scan(self, scan_number: int, run: ScanRun):
+        del self.scanning[scan_number]
+        self.model.finish(scan_number, run)
+
+        if not self.scanning:
+            self.render_scheduler.stop()
+
+        self.on_bar_charts_tab_currentChanged(self.bar_charts_tab.currentIndex())
+
+    @QtCore.pyqtSlot(int, str)
+    def fail_scan(self, scan_number: int, message: str):
+        thread = self.scanning.pop(scan_number)
+        thread.resync_LED_position()
+        self.model.abort(scan_number)
+        self.reset_bar_graph(scan_number)
+
+        if not self.scanning:
+            self.render_scheduler.stop()
+
+        self.on_bar_charts_tab_currentChanged(self.bar_charts_tab.currentIndex())
+
+        QtWidgets.QMessageBox.warning(
+            self.main_window,
+            'Scan Failed',
+            f'Scan {scan_number + 1} on {thread.device_name} stopped part way through, '
+            f'none of its readings were kept.\n\n{message}'
+        )
+
+    @QtCore.pyqtSlot(bool)
+    def on_step_budget_check_box_toggled(self, checked: bool):
+        self.show_step_budget = checked
+        self.step_budget_label.setVisible(
+            checked and self.bar_charts_tab.currentIndex() in self.scanning
+        )
+        settings['show-step-budget'] = checked
+
+    @QtCore.pyqtSlot(str)
+    def on_graph_type_combo_box_currentTextChanged(self, graph_type: str):
+        current_tab = self.bar_charts_tab.currentIndex()
+        if self.all_graph_types_check_box.isChecked():
+            self.graph_type = graph_type
+            for view in self.bar_charts:
+                view.set_graph_type(graph_type)
+            settings['graph-type'] = graph_type
+        else:
+            self.bar_charts[current_tab].set_graph_type(graph_type)
+
+        self.show_scan(current_tab)
+
+    @QtCore.pyqtSlot(bool)
+    def on_triggered_check_box_toggled(self, checked: bool):
+        settings['hardware-triggered-scan'] = checked
+
+    @QtCore.pyqtSlot(int)
+    def on_samples_spin_box_valueChanged(self, value: int):
+        settings['samples-per-LED'] = value
+
+    @QtCore.pyqtSlot(int)
+    def on_sample_rate_spin_box_valueChanged(self, value: int):
+        settings['sample-rate'] = value
+
+    @QtCore.pyqtSlot(str)
+    def on_reducer_combo_box_currentTextChanged(self, reducer: str):
+        settings['reducer'] = reducer
+
+    @QtCore.pyqtSlot()
+    def on_save_button_clicked(self):
+        self.file_dialog.setLabelText(
+            QtWidgets.QFileDialog.DialogLabel.Accept,
+            f'Save Scan {self.bar_charts_tab.currentIndex() + 1}'
+        )
+
+        # NOTE: If the OS is in dark mode, when a file dialog
+        # is displayed it will be all black. For some reason
+        # using the .setWindowIcon method does not change the
+        # icon.  The only way to change the file dialog icon
+        # is to change the main application icon. So in order
+        # for the icon to visible against a black background we
+        # must use the beskar-icon-white.png icon. The code below
+        # will temporarily set the main application icon to the white
+        # icon, while the file dialog is being created so that the
+        # file dialog inherits this icon as its icon. Once the file
+        # dialog is created the original icon is set to the main window.
+
+        if darkdetect.isDark():
+            if not self.main_window.white_icon:
+                white_icon_path = get_file('beskar-icon-white.png')
+                if white_icon_path:
+                    self.main_window.white_icon = QtGui.QIcon(white_icon_path)
+
+            if self.main_window.white_icon:
+                self.main_window.setWindowIcon(self.main_window.white_icon)
+
+        self.file_dialog.open()
+
+        if darkdetect.isDark():
+            QtTest.QTest.qWait(800)
+            if self.main_window.icon:
+                self.main_window.setWindowIcon(self.main_window.icon)
+
+    @QtCore.pyqtSlot(str)
+    def on_file_dialog_filterSelected(self, file_filter: str):
+        if '.png' in file_filter:
+            self.warning_screenshot_dialog.open()
+
+    @QtCore.pyqtSlot()
+    def on_file_dialog_accepted(self):
+        # NOTE: The file dialog automatically handles
+        # attempting to write to folders that require
+        # elevate privileges to write to.
+
+        file_ext = self.file_dialog.selectedNameFilter()
+        selected = pathlib.Path(self.file_dialog.selectedFiles()[0])
+        current_tab = self.bar_charts_tab.currentIndex()
+        if '.csv' in file_ext:
+            with selected.open(mode='w', newline='') as file:
+                writer = csv.writer(file, csv.excel)
+                writer.writerow([f'Column {num + 1}' for num in range(8)])
+                writer.writerows(self.model.wells[current_tab].mean)
+        elif '.npz' in file_ext:
+            save_scan(
+                selected, current_tab, self.model.wells[current_tab], self.model.runs[current_tab]
+            )
+        elif '.png' in file_ext:
+            # TODO: Fix inconsistent and/or bad screenshots
+            self.bar_charts[current_tab].graph.snapshot().save(str(selected))
+        else:
+            raise RuntimeError(f'This should never be triggered: {file_ext=}')
+
+        logger.info(f"'{selected}' has been created in order to save Scan {current_tab + 1}.")
+
+    @QtCore.pyqtSlot()
+    def on_export_button_clicked(self):
+        if self.export_thread is None:
+            self.export_dialog.open()
+
+    @QtCore.pyqtSlot()
+    def on_export_dialog_accepted(self):
+        # NOTE: Only finished scans are exported and their
+        # wells are copied, since scanning can carry on meanwhile.
+        scans = [
+            ExportedScan(
+                scan_number,
+                self.model.devices.get(scan_number),
+                self.model.wells[scan_number].copy(),
+                list(self.model.runs.get(scan_number, []))
+            )
+            for scan_number in sorted(self.model.scanned)
+            if scan_number not in self.scanning
+        ]
+
+        self.export_thread = ExportThread(
+            pathlib.Path(self.export_dialog.selectedFiles()[0]), scans
+        )
+        self.export_thread.progress.connect(self.set_export_progress)
+        self.export_thread.exported.connect(self.finish_export)
+        self.export_thread.failed.connect(self.fail_export)
+        self.export_thread.finished.connect(self.clean_up_export)
+        self.export_progress_dialog.canceled.connect(self.export_thread.cancel)
+
+        self.export_button.setEnabled(False)
+        self.export_progress_dialog.setMaximum(max(len(scans), 1))
+        self.export_progress_dialog.setValue(0)
+
+        logger.info(f"Exporting {len(scans)} scans to '{self.export_thread.folder}'.")
+
+        self.export_thread.start()
+
+    @QtCore.pyqtSlot(int, int)
+    def set_export_progress(self, exported: int, total: int):
+        self.export_progress_dialog.setLabelText(f'Exported {exported} of {total} scans...')
+        self.export_progress_dialog.setValue(exported)
+
+    @QtCore.pyqtSlot(str)
+    def finish_export(self, folder: str):
+        self.export_progress_dialog.reset()
+        QtWidgets.QMessageBox.information(
+            self.main_window,
+            'Export All Scans',
+            f'Every finished scan was exported to {folder}.'
+        )
+
+    @QtCore.pyqtSlot(str)
+    def fail_export(self, error: str):
+        self.export_progress_dialog.reset()
+        QtWidgets.QMessageBox.warning(
+            self.main_window,
+            'Export All Scans',
+            f'The scans could not be exported: {error}'
+        )
+
+    @QtCore.pyqtSlot()
+    def clean_up_export(self):
+        self.export_progress_dialog.canceled.disconnect(self.export_thread.cancel)
+        self.export_progress_dialog.reset()
+        self.export_thread = None
+        self.export_button.setEnabled(True)
+
+    def mousePressEvent(self, mouse_event: QtGui.QMouseEvent = None) -> None:
+        if ((self.start_button.hasFocus() and not self.start_button.underMouse())
+            or (self.save_button.hasFocus() and not self.save_button.underMouse())):
+            self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
+        if mouse_event:
+            super().mousePressEvent(mouse_event)
@@ -1,31 +1,11 @@
-from PyQt6 import QtCore, QtWidgets, QtCharts, QtGui, QtDataVisualization, QtTest
 from .widgets import DoubleSpinBox, LabelWithIcon, LinkHoverColorChange
-from .constants import offset, help_tab_fixed_width, help_tab_margins
+from .utils import BaseInteractable, get_file, assets
+from .animation import FrameAnimator, frame_pixmaps
+from PyQt6 import QtCore, QtWidgets, QtGui
 from typing import Union, Tuple, List
-from nidaqmx.system import System
 from .settings import logging_dir
+from .constants import offset
 from .logs import setUpLogger
-from .utils import (
-    get_number_of_devices,
-    interact_with_LEDs,
-    BaseInteractable,
-    TwoDQBarDataItem,
-    LED_position_gen,
-    apply_voltage,
-    sort_frames,
-    get_folder,
-    get_file
-)
-
-import statistics as stats
-import darkdetect
-import itertools
-import nidaqmx
-import pathlib
-import numpy
-import random
-import time
-import csv
 
 logger = setUpLogger(__name__, logging_dir)
 
@@ -35,22 +15,50 @@ class BasePage(BaseInteractable, QtWidgets.QWidget):
         super().__init__()
 
 
+class SearchingPage(BasePage):
+    def __init__(self, main_window):
+        with self.init(main_window):
+            self.header = QtWidgets.QLabel('Looking for SEAL Kits')
+            self.header.setObjectName('searching_header')
+
+            self.desc = QtWidgets.QLabel('This should only take a moment.')
+            self.desc.setObjectName('searching_desc')
+
+            self.main_layout = QtWidgets.QVBoxLayout()
+            self.main_layout.setSpacing(0)
+            self.main_layout.addWidget(
+                self.header,
+                alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter
+            )
+            self.main_layout.addSpacing(10)
+            self.main_layout.addWidget(
+                self.desc,
+                alignment=QtCore.Qt.AlignmentFlag.AlignTop | QtCore.Qt.AlignmentFlag.AlignHCenter
+            )
+            self.main_layout.addStretch(10)
+
+
 class NoSEALKitPage(BasePage):
     def __init__(
         self,
         main_window,
         have_drivers: bool,
-        refresh_icon_dir_str: str = 'images/refresh-icon-frames'
+        refresh_icon_frames: str = 'refresh-icon-frames'
     ):
         with self.init(main_window):
             self.have_drivers = have_drivers
             self.animation_in_progress = False
 
-            refresh_icon_dir = get_folder(refresh_icon_dir_str)
-            self.refresh_animated = bool(refresh_icon_dir)
+            self.refresh_icon_frames = refresh_icon_frames
+            self.refresh_animated = bool(assets.frames(refresh_icon_frames))
+
+            # NOTE: Without the frames the dots are still animated, just slower.
             if self.refresh_animated:
-                self.frames = sort_frames(refresh_icon_dir, '*.svg')
-                first_refresh_icon_frame = next(self.frames)
+                self.refresh_animator = FrameAnimator(28, 36, self)
+            else:
+                self.refresh_animator = FrameAnimator(5, 200, self)
+            self.refresh_animator.frame_changed.connect(self.animate_refresh)
+            self.refresh_animator.finished.connect(self.finish_refresh)
 
             self.header = QtWidgets.QLabel('No SEAL Kit Detected')
             self.header.setObjectName('no_SEAL_kit_header')
@@ -98,7 +106,7 @@ class NoSEALKitPage(BasePage):
             if refresh_icon_loc := get_file('refresh-icon.svg'):
                 self.refresh_button.setIcon(QtGui.QIcon(refresh_icon_loc))
             elif self.refresh_animated:
-                self.refresh_button.setIcon(QtGui.QIcon(str(first_refresh_icon_frame)))
+                self.refresh_button.setIcon(QtGui.QIcon(self.refresh_frames()[0]))
             self.refresh_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
             self.refresh_button.setFixedWidth(300)
             self.refresh_button.clicked.connect(self.mouse_press_event)
@@ -134,30 +142,43 @@ class NoSEALKitPage(BasePage):
 
             self.refresh_button.setText('Looking')
 
-            if self.refresh_animated:
-                self.animation_in_progress = True
-                for frame_num, frame in zip(range(28), self.frames):
-                    QtTest.QTest.qWait(36)
-                    self.refresh_button.setIcon(QtGui.QIcon(str(frame)))
-                    if frame_num != 0 and frame_num % 5 == 0:
-                        self.refresh_button.setText(f'{self.refresh_button.text()}.')
-            else:
-                for _ in range(5):
-                    QtTest.QTest.qWait(200)
-                    self.refresh_button.setText(f'{self.refresh_button.text()}.')
-            if self.have_drivers:
-                num_of_devices = get_number_of_devices(system=False)
-                if num_of_devices == 0:
-                    self.desc.setText(
-                        '<p style="text-indent: 20px">SEAL kit not detected, '
-                        'try refreshing again.</p>'
-                    )
-                    logger.info('The program failed to find a SEAL kit.')
-                elif self.main_window.stacked_widget.currentIndex() == 0:
-                    logger.info('The program has found a SEAL kit.')
-                    self.main_window.next_page('select')
-            self.animation_in_progress = False
-            self.refresh_button.setText('Refresh')
+            self.main_window.device_watcher.refresh()
+
+            self.animation_in_progress = True
+            self.refresh_animator.start()
+
+    def refresh_frames(self) -> Tuple[QtGui.QPixmap, ...]:
+        size = self.refresh_button.iconSize()
+        return frame_pixmaps(
+            self.refresh_icon_frames, size.width(), size.height(), self.devicePixelRatioF()
+        )
+
+    @QtCore.pyqtSlot(int)
+    def animate_refresh(self, frame_num: int):
+        if self.refresh_animated:
+            frames = self.refresh_frames()
+            self.refresh_button.setIcon(QtGui.QIcon(frames[frame_num % len(frames)]))
+            if frame_num != 0 and frame_num % 5 == 0:
+                self.refresh_button.setText(f'{self.refresh_button.text()}.')
+        else:
+            self.refresh_button.setText(f'{self.refresh_button.text()}.')
+
+    @QtCore.pyqtSlot()
+    def finish_refresh(self):
+        if self.have_drivers:
+            # NOTE: The watcher also moves on by itself once a SEAL kit
+            # shows up, so it may have done so during the animation.
+            if not self.main_window.device_watcher.device_names:
+                self.desc.setText(
+                    '<p style="text-indent: 20px">SEAL kit not detected, '
+                    'try refreshing again.</p>'
+                )
+                logger.info('The program failed to find a SEAL kit.')
+            elif self.main_window.stacked_widget.currentIndex() == 0:
+                logger.info('The program has found a SEAL kit.')
+                self.main_window.next_page('select')
+        self.animation_in_progress = False
+        self.refresh_button.setText('Refresh')
 
     @QtCore.pyqtSlot()
     def on_no_SEAL_kit_button_clicked(self):
@@ -182,31 +203,66 @@ class SelectSEALKitPage(BasePage):
                 self.header, alignment=QtCore.Qt.AlignmentFlag.AlignCenter
             )
             self.main_layout.addSpacing(30)
-            device_names = System.local().devices.device_names
-            logger.debug(f'The following devices were detected {device_names}.')
-            # device_names = [f"Dev {num + 1}" for num in range(4)]
-            for index, device_name in enumerate(device_names):
-                radio_button = QtWidgets.QRadioButton(f" {device_name}")
-                radio_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
-                radio_button.setObjectName(f'select_SEAL_kit_radio_button{index}')
-                radio_button.clicked.connect(self.mouse_press_event)
-                radio_button.setFixedWidth(205)
-                if index == 0:
-                    radio_button.setChecked(True)
-
-                self.buttons_group.addButton(radio_button, id=index)
-                self.main_layout.addWidget(
-                    radio_button,
-                    alignment=QtCore.Qt.AlignmentFlag.AlignCenter
-                )
-                if index != len(device_names) - 1:
-                    self.main_layout.addSpacing(20)
+
+            self.radio_buttons_layout = QtWidgets.QVBoxLayout()
+            self.radio_buttons_layout.setSpacing(20)
+            self.main_layout.addLayout(self.radio_buttons_layout)
+
+            self.scan_all_check_box = QtWidgets.QCheckBox('Scan all SEAL kits at once')
+            self.scan_all_check_box.setObjectName('scan_all_check_box')
+            self.scan_all_check_box.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            self.scan_all_check_box.setFixedWidth(205)
+            self.main_layout.addSpacing(30)
+            self.main_layout.addWidget(
+                self.scan_all_check_box,
+                alignment=QtCore.Qt.AlignmentFlag.AlignCenter
+            )
             self.main_layout.addStretch(10)
 
+            self.set_device_names(self.main_window.device_watcher.device_names)
+
         self.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
 
+    @property
+    def device_names(self) -> List[str]:
+        return [button.text()[1:] for button in self.buttons_group.buttons()]
+
+    def set_device_names(self, device_names: List[str]):
+        checked_button = self.buttons_group.checkedButton()
+        checked_device_name = checked_button.text()[1:] if checked_button else None
+
+        for button in self.buttons_group.buttons():
+            self.buttons_group.removeButton(button)
+            self.radio_buttons_layout.removeWidget(button)
+            button.deleteLater()
+
+        # device_names = [f"Dev {num + 1}" for num in range(4)]
+        for index, device_name in enumerate(device_names):
+            radio_button = QtWidgets.QRadioButton(f" {device_name}")
+            radio_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
+            radio_button.setObjectName(f'select_SEAL_kit_radio_button{index}')
+            radio_button.clicked.connect(self.mouse_press_event)
+            radio_button.setFixedWidth(205)
+
+            self.buttons_group.addButton(radio_button, id=index)
+            self.radio_buttons_layout.addWidget(
+                radio_button,
+                alignment=QtCore.Qt.AlignmentFlag.AlignCenter
+            )
+
+        if device_names:
+            if checked_device_name in device_names:
+                self.buttons_group.button(device_names.index(checked_device_name)).setChecked(True)
+            else:
+                self.buttons_group.button(0).setChecked(True)
+
+        self.scan_all_check_box.setVisible(len(device_names) > 1)
+        if len(device_names) <= 1:
+            self.scan_all_check_box.setChecked(False)
+
     def focusInEvent(self, focus_event: QtGui.QFocusEvent) -> None:
-        self.buttons_group.button(0).setFocus(QtCore.Qt.FocusReason.TabFocusReason)
+        if self.buttons_group.buttons():
+            self.buttons_group.button(0).setFocus(QtCore.Qt.FocusReason.TabFocusReason)
 
     def focusNextPrevChild(self, next_: bool) -> bool:
         buttons = self.buttons_group.buttons()
@@ -362,7 +418,7 @@ class VoltageOffsetPage(BaseSetVoltagePage):
         self.slider.setValue(int(value * 1000))
 
         if not self.main_window.mocked:
-            apply_voltage(self.main_window.device_name, value + offset)
+            self.main_window.apply_voltage(value + offset)
 
 
 class ApplyVoltagePage(BaseSetVoltagePage):
@@ -441,530 +497,3 @@ class ApplyVoltagePage(BaseSetVoltagePage):
     def on_slider_valueChanged(self, value):
         self.voltage_to_be_applied = round(value * 0.001 + self.min_voltage, 3)
         self.double_spin_box.setValue(self.voltage_to_be_applied)
-
-
-class DarkCurrentPage(BasePage):
-    def __init__(self, main_window):
-        with self.init(main_window):
-            self.bar = QtCharts.QBarSeries()
-            self.bar.setLabelsVisible(True)
-            self.bar.setLabelsPosition(
-                QtCharts.QAbstractBarSeries.LabelsPosition.LabelsOutsideEnd
-            )
-
-            self.update_data()
-
-            self.chart = QtCharts.QChart()
-            self.chart.setTheme(QtCharts.QChart.ChartTheme.ChartThemeDark)
-            self.chart.setTitle('Dark Current')
-            title_font = QtGui.QFont()
-            title_font.setPointSizeF(30)
-            title_font.setWeight(700)
-            title_font.setHintingPreference(QtGui.QFont.HintingPreference.PreferFullHinting)
-            self.chart.setTitleFont(title_font)
-            self.chart.addSeries(self.bar)
-
-            self.chart.createDefaultAxes()
-            for axis in self.chart.axes():
-                axis.setGridLineVisible(False)
-                axis.setMinorGridLineVisible(False)
-            x_axis = self.chart.axes(QtCore.Qt.Orientation.Horizontal)[0]
-            x_axis.setTitleText('Sample Number')
-
-            y_axis = self.chart.axes(QtCore.Qt.Orientation.Vertical)[0]
-            font = y_axis.titleFont()
-            font.setHintingPreference(QtGui.QFont.HintingPreference.PreferNoHinting)
-            y_axis.setTitleFont(font)
-            y_axis.setTitleText('Volts')
-
-            self.chart.legend().hide()
-            self.chart.layout().setContentsMargins(0, 0, 0, 0)
-            self.chart.setBackgroundRoundness(30)
-            self.chart.setBackgroundBrush(QtCore.Qt.GlobalColor.black)
-
-            self.set_y_axis_range()
-
-            self.chart_view = QtCharts.QChartView(self.chart)
-            self.chart_view.setObjectName('dark_current_chart_view')
-            self.chart_view.setViewportUpdateMode(
-                QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate
-            )
-            self.chart_view.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-            self.chart_view.setMinimumSize(630, 500)
-
-            self.refresh_button = QtWidgets.QPushButton('Refresh')
-            self.refresh_button.setObjectName('dark_current_refresh_button')
-            self.refresh_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
-            self.refresh_button.setFixedWidth(100)
-
-            self.chart_layout = QtWidgets.QVBoxLayout()
-            self.chart_layout.addWidget(self.chart_view)
-            self.chart_layout.setSpacing(30)
-            self.chart_layout.addWidget(self.refresh_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
-
-            self.help_tab = QtWidgets.QLabel(get_file('dark-current.md', 'desc', path=True).read_text())
-            self.help_tab.setTextFormat(QtCore.Qt.TextFormat.RichText)
-            self.help_tab.setFixedWidth(help_tab_fixed_width)
-            self.help_tab.setWordWrap(True)
-
-            self.desc_layout = QtWidgets.QVBoxLayout()
-            self.desc_layout.addWidget(self.help_tab)
-            self.desc_layout.addStretch(40)
-            self.desc_layout.setContentsMargins(help_tab_margins)
-
-            self.main_layout = QtWidgets.QHBoxLayout()
-            self.main_layout.addLayout(self.chart_layout)
-            self.main_layout.addSpacing(30)
-            self.main_layout.addLayout(self.desc_layout)
-            self.main_layout.setContentsMargins(
-                30, 30, 11, 11
-            )
-
-    def update_data(self):
-        self.bar.clear()
-
-        if self.main_window.mocked:
-            samples = [random.random() * 0.6 for _ in range(10)]
-        else:
-            with nidaqmx.Task() as task:
-                task.ai_channels.add_ai_voltage_chan(
-                    f"{self.main_window.device_name}/ai1",
-                    min_val=-10,
-                    max_val=10
-                )
-                samples = task.read(number_of_samples_per_channel=10)
-
-        bar_set = QtCharts.QBarSet('Values')
-        bar_set.setLabelColor(QtCore.Qt.GlobalColor.white)
-        bar_set.setBrush(0x73C2FB)
-        bar_set.setBorderColor(QtGui.QColor(0, 0, 0, 0))
-        bar_set.append(samples)
-
-        self.bar.append(bar_set)
-
-        if max(samples) > 0.9:
-            self.set_y_axis_range(max(samples) * 1.1)
-
-        logger.info('Updated dark current readings.')
-
-        self.main_window.wait_condition.set()
-        self.main_window.wait_condition.clear()
-
-    def set_y_axis_range(self, upper: Union[float, int] = None):
-        if upper is None:
-            upper = max(self.samples) * 1.1
-            if upper < 1:
-                upper = 1
-
-        if hasattr(self, 'chart'):
-            self.chart.axes(QtCore.Qt.Orientation.Vertical)[0].setRange(0, upper)
-
-    @property
-    def samples(self):
-        return [sample for sample in self.bar.barSets()[0]]
-
-    @QtCore.pyqtSlot()
-    def on_dark_current_refresh_button_clicked(self):
-        self.update_data()
-
-    def mousePressEvent(self, mouse_event: QtGui.QMouseEvent = None) -> None:
-        if self.refresh_button.hasFocus() and not self.refresh_button.underMouse():
-            self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
-        if mouse_event:
-            super().mousePressEvent(mouse_event)
-
-
-class ScanThread(QtCore.QThread):
-    update_dark_current = QtCore.pyqtSignal()
-    update_progress_bar = QtCore.pyqtSignal(int)
-
-    set_maximum_progress_bar = QtCore.pyqtSignal(int)
-
-    show_progress_bar = QtCore.pyqtSignal()
-    show_save_button = QtCore.pyqtSignal()
-    show_notice_for_reading = QtCore.pyqtSignal()
-
-    hide_start_button = QtCore.pyqtSignal()
-    hide_notice_for_reading = QtCore.pyqtSignal()
-
-    def __init__(self, scan_page: 'ScanPage'):
-        super().__init__()
-
-        self.scan_page = scan_page
-
-        self.connect_signals()
-
-    def connect_signals(self):
-        self.update_dark_current.connect(
-            self.scan_page.main_window.dark_current_widget.update_data
-        )
-        self.update_progress_bar.connect(
-            self.scan_page.progress_bar.setValue
-        )
-
-        self.set_maximum_progress_bar.connect(
-            self.scan_page.progress_bar.setMaximum
-        )
-
-        self.show_progress_bar.connect(
-            self.scan_page.scanning_progress_label.show
-        )
-        self.show_progress_bar.connect(
-            self.scan_page.progress_bar.show
-        )
-        self.show_save_button.connect(
-            self.scan_page.save_button.show
-        )
-        self.show_notice_for_reading.connect(
-            self.scan_page.notice_for_reading.show
-        )
-
-        self.hide_start_button.connect(
-            self.scan_page.start_button.hide
-        )
-        self.hide_notice_for_reading.connect(
-            self.scan_page.notice_for_reading.hide
-        )
-
-    def run(self):
-        self.scan_page.scan_index = scan_number = self.scan_page.bar_charts_tab.currentIndex()
-
-        logger.info(f'Scan {scan_number + 1} was initiated.')
-
-        self.show_progress_bar.emit()
-
-        self.hide_start_button.emit()
-        self.show_save_button.emit()
-
-        self.update_progress_bar.emit(0)
-
-        self.scan_page.save_button.setEnabled(False)
-
-        self.scan_page.scanning_thread.update_dark_current.emit()
-        self.scan_page.main_window.wait_condition.wait()
-
-        dark_current = stats.mean(self.scan_page.main_window.dark_current_widget.samples)
-
-        length = 64 if len(self.scan_page.led_position) == 3 else 65
-        self.set_maximum_progress_bar.emit(length)
-
-        if not self.scan_page.main_window.mocked:
-            interact_with_LEDs(self.scan_page.main_window.device_name, 'on&off')
-
-        # Delay for signal to flash LEDs
-        time.sleep(0.412)
-
-        for progress in range(length):
-            if self.scan_page.main_window.exiting:
-                return
-            loop_start = time.time()
-            if self.scan_page.main_window.mocked:
-                samples = [random.random() for _ in range(10)]
-                # samples = [dark_current] * 10
-            else:
-                with nidaqmx.Task() as task:
-                    task.ai_channels.add_ai_voltage_chan(
-                        f'{self.scan_page.main_window.device_name}/ai1', min_val=-10, max_val=10
-                    )
-                    samples = task.read(10)
-            self.scan_page.bar_charts[scan_number][2][
-                self.scan_page.led_position[0], self.scan_page.led_position[1]
-            ] = max(samples) - dark_current
-
-            self.scan_page.bar_charts[scan_number][1].dataProxy().resetArray(
-                    self.scan_page.bar_charts[scan_number][2].tolist(convert_to_bar_data=True)
-            )
-
-            self.update_progress_bar.emit(progress + 1)
-
-            self.scan_page.led_position = next(self.scan_page.led_position_gen)
-
-            if self.scan_page.bar_charts_tab.currentIndex() == scan_number:
-                if self.scan_page.bar_charts[scan_number][2].last_values_zero():
-                    logger.debug('The last four values read from the SEAL kit have been zeros.')
-                    self.show_notice_for_reading.emit()
-                else:
-                    self.hide_notice_for_reading.emit()
-
-            computation_time = time.time() - loop_start
-
-            if progress == 0:
-                # Delay between the first and second LED flash
-                time.sleep(0.492 - computation_time)
-            elif progress == 1:
-                # Delay between second and thrid LED flash
-                time.sleep(0.820 - 0.001 - computation_time)
-            else:
-                # Delay between all other LED flashes
-                time.sleep(0.860 - 0.001 - computation_time)
-
-        self.scan_page.scanned.append(self.scan_page.scan_index)
-        self.scan_page.scan_index = None
-
-        self.scan_page.save_button.setEnabled(True)
-        self.scan_page.start_button.setEnabled(True)
-
-        self.hide_notice_for_reading.emit()
-
-        logger.info(f'Scan {scan_number + 1} ended.')
-
-
-class ScanPage(BasePage):
-    def __init__(self, main_window):
-        with self.init(main_window):
-            self.led_position_gen = LED_position_gen(start_at_zero=True)
-            self.led_position = next(self.led_position_gen)
-
-            self.scanned = []
-
-            self.scan_index = None
-            self.last_scanned = None
-
-            self.scan_label = QtWidgets.QLabel('Scan')
-            font = self.scan_label.font()
-            font.setHintingPreference(QtGui.QFont.HintingPreference.PreferFullHinting)
-            self.scan_label.setFont(font)
-            self.scan_label.setObjectName('scan_page_header')
-
-            self.bar_charts: List[
-                List[
-                    QtDataVisualization.Q3DBars,
-                    QtDataVisualization.QBar3DSeries,
-                    TwoDQBarDataItem,
-                    QtWidgets.QWidget
-                ]
-            ] = list()
-
-
-            self.bar_charts_tab = QtWidgets.QTabWidget()
-            self.bar_charts_tab.setObjectName('bar_charts_tab')
-
-            self.create_bar_graph()
-
-            self.bar_charts_tab.addTab(QtWidgets.QWidget(), '')
-
-            self.scanning_progress_label = QtWidgets.QLabel('Scanning progress:')
-            self.scanning_progress_label.hide()
-
-            self.progress_bar = QtWidgets.QProgressBar()
-            sp_retain = self.progress_bar.sizePolicy()
-            sp_retain.setRetainSizeWhenHidden(True)
-            self.progress_bar.setSizePolicy(sp_retain)
-            self.progress_bar.hide()
-
-            self.progress_bar_layout = QtWidgets.QHBoxLayout()
-            self.progress_bar_layout.addWidget(self.scanning_progress_label)
-            self.progress_bar_layout.addSpacing(10)
-            self.progress_bar_layout.addWidget(self.progress_bar)
-
-            self.notice_for_reading = QtWidgets.QLabel(
-                'Even though it looks like nothing is happening, <b>data is still being read!</b> '
-                "The reason you can't see anything happening on screen is because the values being "
-                'read are zeros.'
-            )
-            sp_retain = self.notice_for_reading.sizePolicy()
-            sp_retain.setVerticalPolicy(QtWidgets.QSizePolicy.Policy.Fixed)
-            sp_retain.setRetainSizeWhenHidden(True)
-            self.notice_for_reading.setSizePolicy(sp_retain)
-            self.notice_for_reading.hide()
-
-            self.start_button = QtWidgets.QPushButton('Start')
-            self.start_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
-            self.start_button.setObjectName('start_button')
-
-            self.save_button = QtWidgets.QPushButton('Save')
-            self.save_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
-            self.save_button.setObjectName('save_button')
-            self.save_button.setEnabled(False)
-            self.save_button.hide()
-
-            self.buttons_layout = QtWidgets.QHBoxLayout()
-            self.buttons_layout.setSpacing(0)
-            self.buttons_layout.addStretch(100)
-            self.buttons_layout.addWidget(self.start_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
-            self.buttons_layout.addWidget(self.save_button, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
-
-            self.bar_chart_layout = QtWidgets.QVBoxLayout()
-            self.bar_chart_layout.setSpacing(0)
-            self.bar_chart_layout.addWidget(self.scan_label, alignment=QtCore.Qt.AlignmentFlag.AlignHCenter)
-            self.bar_chart_layout.addWidget(self.bar_charts_tab)
-            self.bar_chart_layout.addSpacing(10)
-            self.bar_chart_layout.addLayout(self.progress_bar_layout)
-            self.bar_chart_layout.addSpacing(10)
-            self.bar_chart_layout.addWidget(self.notice_for_reading, alignment=QtCore.Qt.AlignmentFlag.AlignRight)
-            self.bar_chart_layout.addSpacing(10)
-            self.bar_chart_layout.addLayout(self.buttons_layout)
-
-            self.help_tab = LinkHoverColorChange('#0078D8', '#777777', get_file('scan.md', 'desc', path=True).read_text())
-            self.help_tab.setTextFormat(QtCore.Qt.TextFormat.RichText)
-            self.help_tab.setOpenExternalLinks(True)
-            self.help_tab.setFixedWidth(help_tab_fixed_width)
-            self.help_tab.setWordWrap(True)
-
-            self.desc_layout = QtWidgets.QVBoxLayout()
-            self.desc_layout.addWidget(self.help_tab)
-            self.desc_layout.addStretch(40)
-            self.desc_layout.setContentsMargins(help_tab_margins)
-
-            self.main_layout = QtWidgets.QHBoxLayout()
-            self.main_layout.addLayout(self.bar_chart_layout)
-            self.main_layout.addSpacing(30)
-            self.main_layout.addLayout(self.desc_layout)
-            self.main_layout.setContentsMargins(
-                30, 30, 11, 11
-            )
-
-            self.file_dialog = QtWidgets.QFileDialog(
-                self.main_window,
-                caption=f'Saving Scan',
-                filter='CSV File (*.csv);;Screenshot (*.png)'
-            )
-            # NOTE: For some reason connectSlotsByName is not working
-            # self.file_dialog.setObjectName('file_dialog')
-            self.file_dialog.filterSelected.connect(self.on_file_dialog_filterSelected)
-            self.file_dialog.accepted.connect(self.on_file_dialog_accepted)
-            self.file_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptMode.AcceptSave)
-
-            self.warning_screenshot_dialog = QtWidgets.QMessageBox(
-                QtWidgets.QMessageBox.Icon.Warning,
-                'Screenshots may not work properly',
-                'Screenshots are still in beta and may not accurately '
-                'capture the current view.',
-                QtWidgets.QMessageBox.StandardButton.Ok,
-                self.main_window
-            )
-
-            self.scanning_thread = ScanThread(self)
-
-    def create_bar_graph(self, index=0):
-        # TODO: Figure out how to make bars matte
-
-        graph_components = [
-            QtDataVisualization.Q3DBars(),
-            QtDataVisualization.QBar3DSeries(),
-            numpy.zeros((8, 8)).view(TwoDQBarDataItem)
-        ]
-
-        bars: QtDataVisualization.Q3DBars = graph_components[0]
-        bars.addSeries(graph_components[1])
-        bars.rowAxis().setRange(0, 7)
-        bars.columnAxis().setRange(0, 7)
-        bars.setShadowQuality(QtDataVisualization.QAbstract3DGraph.ShadowQuality.ShadowQualityNone)
-        theme = QtDataVisualization.Q3DTheme(QtDataVisualization.Q3DTheme.Theme.ThemeEbony)
-        theme.setAmbientLightStrength(0.5)
-        theme.setBaseColors([0x73C2FB])
-        theme.setSingleHighlightColor(0xFFFFFF)
-        font = theme.font()
-        font.setBold(True)
-        theme.setFont(font)
-        bars.setActiveTheme(theme)
-        graph_components.append(QtWidgets.QWidget.createWindowContainer(bars))
-
-        self.bar_charts.append(graph_components)
-
-        self.bar_charts_tab.insertTab(
-            index,
-            self.bar_charts[len(self.bar_charts) - 1][3],
-            f'Scan {len(self.bar_charts)}'
-        )
-
-        logger.info(f'A new 3D bar chart created for Scan {len(self.bar_charts)}.')
-
-    @QtCore.pyqtSlot(int)
-    def on_bar_charts_tab_currentChanged(self, tab: int):
-        if tab + 1 == len(self.bar_charts_tab):
-            self.create_bar_graph(tab)
-            self.bar_charts_tab.setCurrentIndex(tab)
-        elif tab == self.scan_index:
-            self.scanning_progress_label.show()
-            self.progress_bar.show()
-            self.start_button.hide()
-            self.save_button.show()
-            self.save_button.setEnabled(False)
-        elif tab in self.scanned:
-            self.start_button.hide()
-            self.save_button.show()
-            self.save_button.setEnabled(True)
-            self.notice_for_reading.hide()
-        else:
-            self.progress_bar.hide()
-            self.scanning_progress_label.hide()
-            self.notice_for_reading.hide()
-            self.save_button.hide()
-            self.start_button.show()
-            self.start_button.setEnabled(self.scan_index is None)
-
-    @QtCore.pyqtSlot()
-    def on_start_button_clicked(self):
-        if not self.scanning_thread.isRunning():
-            self.scanning_thread.start()
-
-    @QtCore.pyqtSlot()
-    def on_save_button_clicked(self):
-        self.file_dialog.setLabelText(
-            QtWidgets.QFileDialog.DialogLabel.Accept,
-            f'Save Scan {self.bar_charts_tab.currentIndex() + 1}'
-        )
-
-        # NOTE: If the OS is in dark mode, when a file dialog
-        # is displayed it will be all black. For some reason
-        # using the .setWindowIcon method does not change the
-        # icon.  The only way to change the file dialog icon
-        # is to change the main application icon. So in order
-        # for the icon to visible against a black background we
-        # must use the beskar-icon-white.png icon. The code below
-        # will temporarily set the main application icon to the white
-        # icon, while the file dialog is being created so that the
-        # file dialog inherits this icon as its icon. Once the file
-        # dialog is created the original icon is set to the main window.
-
-        if darkdetect.isDark():
-            if not self.main_window.white_icon:
-                white_icon_path = get_file('beskar-icon-white.png')
-                if white_icon_path:
-                    self.main_window.white_icon = QtGui.QIcon(white_icon_path)
-
-            if self.main_window.white_icon:
-                self.main_window.setWindowIcon(self.main_window.white_icon)
-
-        self.file_dialog.open()
-
-        if darkdetect.isDark():
-            QtTest.QTest.qWait(800)
-            if self.main_window.icon:
-                self.main_window.setWindowIcon(self.main_window.icon)
-
-    @QtCore.pyqtSlot(str)
-    def on_file_dialog_filterSelected(self, file_filter: str):
-        if '.png' in file_filter:
-            self.warning_screenshot_dialog.open()
-
-    @QtCore.pyqtSlot()
-    def on_file_dialog_accepted(self):
-        # NOTE: The file dialog automatically handles
-        # attempting to write to folders that require
-        # elevate privileges to write to.
-
-        file_ext = self.file_dialog.selectedNameFilter()
-        selected = pathlib.Path(self.file_dialog.selectedFiles()[0])
-        current_tab = self.bar_charts_tab.currentIndex()
-        if '.csv' in file_ext:
-            with selected.open(mode='w', newline='') as file:
-                writer = csv.writer(file, csv.excel)
-                writer.writerow([f'Column {num + 1}' for num in range(8)])
-                writer.writerows(self.bar_charts[current_tab][2])
-        elif '.png' in file_ext:
-            # TODO: Fix inconsistent and/or bad screenshots
-            q3dbar = self.bar_charts[current_tab][0]
-            q3dbar.renderToImage().save(str(selected))
-        else:
-            raise RuntimeError(f'This should never be triggered: {file_ext=}')
-
-        logger.info(f"'{selected}' has been created in order to save Scan {current_tab + 1}.")
-
-    def mousePressEvent(self, mouse_event: QtGui.QMouseEvent = None) -> None:
-        if ((self.start_button.hasFocus() and not self.start_button.underMouse())
-            or (self.save_button.hasFocus() and not self.save_button.underMouse())):
-            self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
-        if mouse_event:
-            super().mousePressEvent(mouse_event)
@@ -1,12 +1,14 @@
-from .utils import BaseInteractable, apply_voltage, get_file, get_number_of_devices
+from .utils import BaseInteractable, apply_voltage, get_file
 from .constants import offset, __version__
 from PyQt6 import QtCore, QtWidgets, QtGui
 from .widgets import StepProgressBar
+from typing import List, Literal, Union
 from .settings import logging_dir
 from . import sys_info, settings
+from .devices import DeviceWatcher
 from .logs import setUpLogger
-from typing import Literal
 from .pages import (
+    SearchingPage,
     NoSEALKitPage,
     SelectSEALKitPage,
     VoltageOffsetPage,
@@ -31,7 +33,10 @@ class StartUpPopup(BasePopup):
 
             self.device_name = None
 
-            system, num_of_devices, drivers = get_number_of_devices(drivers=True)
+            self.device_names: List[str] = []
+
+            self.device_watcher = DeviceWatcher()
+            self.device_watcher.devices_changed.connect(self.update_devices)
 
             self.next_button = QtWidgets.QPushButton('Next')
             self.next_button.setFocusPolicy(QtCore.Qt.FocusPolicy.TabFocus)
@@ -55,30 +60,21 @@ class StartUpPopup(BasePopup):
 
             self.mocked_mode_page = None
 
-            if num_of_devices == 0:
-                logger.info('No SEAL kit was detected.')
-                self.no_SEAL_kit_page = NoSEALKitPage(self, drivers)
-                self.total_steps = 4
-                self.stacked_widget.addWidget(self.no_SEAL_kit_page)
-                self.next_button.hide()
-            elif num_of_devices == 1:
-                self.device_name = system.devices.device_names[0]
-                logger.info(f'A single SEAL kit was detected: {self.device_name}.')
-                apply_voltage(self.device_name)
-                self.total_steps = 2
-            else:
-                logger.info('Multiple SEAL kits were detected.')
-                self.select_SEAL_kit_page = SelectSEALKitPage(self)
-                self.stacked_widget.addWidget(self.select_SEAL_kit_page)
-                self.total_steps = 3
+            self.no_SEAL_kit_page = None
+
+            # NOTE: Looking for SEAL kits can take a while so the popup is
+            # shown right away and the pages are set up once the watcher is done.
+            self.searching_page = SearchingPage(self)
+            self.stacked_widget.addWidget(self.searching_page)
+            self.next_button.hide()
 
-            self.step_progress_bar = StepProgressBar(self.total_steps)
+            self.total_steps = None
+
+            self.step_progress_bar = StepProgressBar(2)
 
             self.voltage_offset_page = VoltageOffsetPage(self)
 
             self.apply_voltage_page = ApplyVoltagePage(self)
-            self.stacked_widget.addWidget(self.voltage_offset_page)
-            self.stacked_widget.addWidget(self.apply_voltage_page)
 
             self.main_layout = QtWidgets.QVBoxLayout()
             self.main_layout.addWidget(self.step_progress_bar)
@@ -95,7 +91,60 @@ class StartUpPopup(BasePopup):
         self.setMinimumSize(430, 650)
         self.resize(560, 650)
 
+        self.device_watcher.start()
+
+    def set_up_pages(self, device_names: List[str], drivers: bool):
+        self.stacked_widget.removeWidget(self.searching_page)
+        self.searching_page.deleteLater()
+        self.searching_page = None
+
+        if len(device_names) == 0:
+            logger.info('No SEAL kit was detected.')
+            self.no_SEAL_kit_page = NoSEALKitPage(self, drivers)
+            self.total_steps = 4
+            self.stacked_widget.addWidget(self.no_SEAL_kit_page)
+        elif len(device_names) == 1:
+            self.device_name = device_names[0]
+            self.device_names = [self.device_name]
+            logger.info(f'A single SEAL kit was detected: {self.device_name}.')
+            self.total_steps = 2
+        else:
+            logger.info('Multiple SEAL kits were detected.')
+            self.select_SEAL_kit_page = SelectSEALKitPage(self)
+            self.stacked_widget.addWidget(self.select_SEAL_kit_page)
+            self.total_steps = 3
+
+        self.step_progress_bar.set_total_steps(self.total_steps)
+
+        self.stacked_widget.addWidget(self.voltage_offset_page)
+        self.stacked_widget.addWidget(self.apply_voltage_page)
+
+        self.set_page_index(0)
+
+    @QtCore.pyqtSlot(list, bool)
+    def update_devices(self, device_names: List[str], drivers: bool):
+        if self.total_steps is None:
+            self.set_up_pages(device_names, drivers)
+            return
+
+        if self.select_SEAL_kit_page:
+            self.select_SEAL_kit_page.set_device_names(device_names)
+
+        if self.stacked_widget.currentWidget() == self.no_SEAL_kit_page:
+            if device_names and not self.no_SEAL_kit_page.animation_in_progress:
+                logger.info('A SEAL kit was plugged in.')
+                self.next_page('select')
+        elif self.device_name and self.device_name not in device_names and not self.mocked:
+            logger.warning(f'{self.device_name} is no longer connected.')
+
     def next_page(self, widget: Literal['mocked', 'select', None] = None):
+        if (
+            self.select_SEAL_kit_page
+            and self.stacked_widget.currentWidget() == self.select_SEAL_kit_page
+            and self.select_SEAL_kit_page.buttons_group.checkedButton() is None
+        ):
+            logger.info('The user attempted to continue without a SEAL kit to select.')
+            return
         if self.stacked_widget.currentWidget() == self.voltage_offset_page:
             settings['voltage-offset'] = self.voltage_offset_page.double_spin_box.value()
         self.set_page_index(self.stacked_widget.currentIndex() + 1, widget)
@@ -109,6 +158,8 @@ class StartUpPopup(BasePopup):
                 self.next_button.hide()
                 if (window_title := f'Beskar {__version__}') != self.windowTitle():
                     self.setWindowTitle(window_title)
+            else:
+                self.next_button.show()
         else:
             self.back_button.show()
             self.next_button.show()
@@ -121,7 +172,7 @@ class StartUpPopup(BasePopup):
                 )
                 if self.apply_voltage_page.is_high_or_low_voltage(voltage_to_apply):
                     logger.debug('A possible extremely low or high amount of voltage has been applied.')
-                apply_voltage(self.device_name, voltage_to_apply)
+                self.apply_voltage(voltage_to_apply)
             settings['applied-voltage'] = self.apply_voltage_page.double_spin_box.value()
             logger.info('User finished inputting information into the StartUpPopup.')
             self.accept()
@@ -151,13 +202,24 @@ class StartUpPopup(BasePopup):
             if self.select_SEAL_kit_page:
                 self.device_name = self.select_SEAL_kit_page.buttons_group. \
                     checkedButton().text()[1:]
+                if self.select_SEAL_kit_page.scan_all_check_box.isChecked():
+                    # NOTE: The selected SEAL kit goes first so it is
+                    # the one shown on the dark current page.
+                    self.device_names = [self.device_name] + [
+                        device_name
+                        for device_name in self.select_SEAL_kit_page.device_names
+                        if device_name != self.device_name
+                    ]
+                    logger.info(f'Multi SEAL kit mode was enabled for {self.device_names}.')
+                else:
+                    self.device_names = [self.device_name]
             if not self.voltage_offset_page.set_with_settings:
                 self.voltage_offset_page.double_spin_box.setValue(
                     settings.get('voltage-offset', 0)
                 )
                 self.voltage_offset_page.set_with_settings = True
                 if not self.mocked:
-                    apply_voltage(self.device_name)
+                    self.apply_voltage()
         elif self.stacked_widget.indexOf(self.apply_voltage_page) == index:
             self.apply_voltage_page.set_min_and_max(
                 self.voltage_offset_page.double_spin_box.value()
@@ -177,6 +239,14 @@ class StartUpPopup(BasePopup):
             self.stacked_widget.setCurrentIndex(index)
             self.set_focus()
 
+    def done(self, result: int):
+        self.device_watcher.stop()
+        super().done(result)
+
+    def apply_voltage(self, voltage: Union[float, int] = offset):
+        for device_name in self.device_names:
+            apply_voltage(device_name, voltage)
+
     def set_focus(self):
         self.setFocus(QtCore.Qt.FocusReason.OtherFocusReason)
 
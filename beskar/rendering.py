@@ -0,0 +1,50 @@
+from typing import Callable, Set, Tuple
+from .constants import max_render_fps
+from PyQt6 import QtCore
+
+import threading
+
+
+class RenderScheduler(QtCore.QObject):
+    def __init__(
+        self,
+        render: Callable[[int, int, int], None],
+        max_fps: float = max_render_fps,
+        parent: QtCore.QObject = None
+    ):
+        super().__init__(parent)
+
+        self.render = render
+
+        # NOTE: Scanning threads only mark which bars changed, the GUI
+        # thread reads their latest values whenever the timer fires.
+        self.pending: Set[Tuple[int, int, int]] = set()
+        self.lock = threading.Lock()
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.flush)
+        self.set_max_fps(max_fps)
+
+    def set_max_fps(self, max_fps: float):
+        if max_fps <= 0:
+            raise ValueError(f'max_fps must be greater than 0, not {max_fps}')
+        self.timer.setInterval(max(1, round(1000 / max_fps)))
+
+    def schedule(self, scan_number: int, row: int, column: int):
+        with self.lock:
+            self.pending.add((scan_number, row, column))
+
+    def start(self):
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        self.flush()
+
+    @QtCore.pyqtSlot()
+    def flush(self):
+        with self.lock:
+            pending, self.pending = self.pending, set()
+        for scan_number, row, column in pending:
+            self.render(scan_number, row, column)
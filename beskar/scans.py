@@ -0,0 +1,199 @@
+from typing import Dict, List, NamedTuple, Tuple, Union
+from .acquisition import AcquisitionSettings
+from .timing import JitterReport, ScanTrace
+from PyQt6 import QtCore
+
+import threading
+import numpy
+
+
+class RingBuffer:
+    def __init__(self, capacity: int, dtype=float):
+        self.data = numpy.zeros(capacity, dtype=dtype)
+        self.capacity = capacity
+        self.size = 0
+        self.end = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def extend(self, values):
+        values = numpy.asarray(values, dtype=self.data.dtype)[-self.capacity:]
+        with self.lock:
+            first = min(len(values), self.capacity - self.end)
+            self.data[self.end:self.end + first] = values[:first]
+            self.data[:len(values) - first] = values[first:]
+            self.end = (self.end + len(values)) % self.capacity
+            self.size = min(self.size + len(values), self.capacity)
+
+    def latest(self, count: int = None) -> numpy.ndarray:
+        with self.lock:
+            if count is None or count > self.size:
+                count = self.size
+            return self.data.take(
+                numpy.arange(self.end - count, self.end), mode='wrap'
+            )
+
+    def copy(self) -> 'RingBuffer':
+        ring = RingBuffer(self.capacity, self.data.dtype)
+        with self.lock:
+            ring.data[:] = self.data
+            ring.size = self.size
+            ring.end = self.end
+        return ring
+
+
+class WellAccumulator:
+    def __init__(self, rows: int = 8, columns: int = 8, recent: int = 4):
+        shape = (rows, columns)
+
+        self.count = numpy.zeros(shape, dtype=int)
+        self.mean = numpy.zeros(shape)
+        self.M2 = numpy.zeros(shape)
+        self.min = numpy.full(shape, numpy.inf)
+        self.max = numpy.full(shape, -numpy.inf)
+
+        self.recent = RingBuffer(recent)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.mean.shape
+
+    def add(self, row: int, column: int, value: float):
+        # NOTE: Welford's algorithm, every reading of a well counts the
+        # same no matter how many scans came before it.
+        self.count[row, column] += 1
+        delta = value - self.mean[row, column]
+        self.mean[row, column] += delta / self.count[row, column]
+        self.M2[row, column] += delta * (value - self.mean[row, column])
+
+        if value < self.min[row, column]:
+            self.min[row, column] = value
+        if value > self.max[row, column]:
+            self.max[row, column] = value
+
+        self.recent.extend((value,))
+
+    @property
+    def variance(self) -> numpy.ndarray:
+        variance = numpy.zeros(self.shape)
+        numpy.divide(self.M2, self.count - 1, out=variance, where=self.count > 1)
+        return variance
+
+    @property
+    def std(self) -> numpy.ndarray:
+        return numpy.sqrt(self.variance)
+
+    def copy(self) -> 'WellAccumulator':
+        wells = WellAccumulator(*self.shape, self.recent.capacity)
+        wells.count[:] = self.count
+        wells.mean[:] = self.mean
+        wells.M2[:] = self.M2
+        wells.min[:] = self.min
+        wells.max[:] = self.max
+        wells.recent = self.recent.copy()
+        return wells
+
+    def last_values_zero(self) -> bool:
+        return len(self.recent) == self.recent.capacity and not self.recent.latest().any()
+
+
+class StepResult(NamedTuple):
+    scan_number: int
+    step: int
+    steps: int
+    row: int
+    column: int
+    value: float
+    busy: float
+
+
+class ScanRun(NamedTuple):
+    device_name: Union[str, None]
+    started: str
+    acquisition: AcquisitionSettings
+    hardware_triggered: bool
+    voltage: Union[float, None]
+    applied_voltage: Union[float, None]
+    voltage_offset: Union[float, None]
+    offset: float
+    dark_current: float
+    dark_current_samples: numpy.ndarray
+    readings: numpy.ndarray
+    trace: ScanTrace
+    jitter_report: JitterReport
+
+
+class ScanModel(QtCore.QObject):
+    well_changed = QtCore.pyqtSignal(int, int, int)
+
+    progress_changed = QtCore.pyqtSignal(int, int, int)
+
+    # NOTE: Only ever touched from the GUI thread, the scanning
+    # threads hand over their readings through queued signals.
+    def __init__(self, parent: QtCore.QObject = None):
+        super().__init__(parent)
+
+        self.wells: List[WellAccumulator] = []
+
+        self.progress: Dict[int, List[int]] = {}
+
+        self.devices: Dict[int, Union[str, None]] = {}
+
+        self.jitter_reports: Dict[int, JitterReport] = {}
+
+        self.traces: Dict[int, ScanTrace] = {}
+
+        # NOTE: Every time a scan is run its raw readings are kept for archiving.
+        self.runs: Dict[int, List[ScanRun]] = {}
+
+        self.scanned: List[int] = []
+
+        # NOTE: What a scan looked like before it was started, so a
+        # scan that fails part way through can be undone.
+        self.before: Dict[int, Tuple[WellAccumulator, Union[str, None]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.wells)
+
+    def add_scan(self) -> int:
+        self.wells.append(WellAccumulator())
+        return len(self.wells) - 1
+
+    def begin(self, scan_number: int, device_name: Union[str, None], steps: int = 65):
+        self.before[scan_number] = (
+            self.wells[scan_number].copy(), self.devices.get(scan_number)
+        )
+        self.progress[scan_number] = [0, steps]
+        self.devices[scan_number] = device_name
+        self.progress_changed.emit(scan_number, 0, steps)
+
+    def set_steps(self, scan_number: int, steps: int):
+        self.progress[scan_number][1] = steps
+        self.progress_changed.emit(scan_number, self.progress[scan_number][0], steps)
+
+    @QtCore.pyqtSlot(object)
+    def record(self, result: StepResult):
+        self.wells[result.scan_number].add(result.row, result.column, result.value)
+        self.progress[result.scan_number] = [result.step + 1, result.steps]
+
+        self.well_changed.emit(result.scan_number, result.row, result.column)
+        self.progress_changed.emit(result.scan_number, result.step + 1, result.steps)
+
+    def abort(self, scan_number: int):
+        del self.progress[scan_number]
+        wells, device_name = self.before.pop(scan_number)
+        self.wells[scan_number] = wells
+        if device_name is None:
+            self.devices.pop(scan_number, None)
+        else:
+            self.devices[scan_number] = device_name
+
+    def finish(self, scan_number: int, run: ScanRun):
+        del self.before[scan_number]
+        self.jitter_reports[scan_number] = run.jitter_report
+        self.traces[scan_number] = run.trace
+        self.runs.setdefault(scan_number, []).append(run)
+        if scan_number not in self.scanned:
+            self.scanned.append(scan_number)
@@ -1,10 +1,14 @@
-from contextlib import contextmanager
-from .constants import __version__
+from .constants import __version__, settings_write_delay, settings_watch_interval
 from typing import Literal, Union
 from .logs import setUpLogger
 
+import contextlib
+import threading
+import tempfile
 import pathlib
+import atexit
 import json
+import time
 import os
 
 
@@ -29,13 +33,22 @@ else:
     if not logging_dir.exists():
         logging_dir.mkdir()
 
+traces_dir = logging_dir.parent / 'traces'
+if not traces_dir.exists():
+    traces_dir.mkdir()
+
 logger = setUpLogger(__name__, logging_dir)
 
 logger.info(f'Logging directory set to {logging_dir}.')
 
 
 class Settings:
-    def __init__(self, location: Union[str, Literal[r'C:\Program Data']] = None):
+    def __init__(
+        self,
+        location: Union[str, Literal[r'C:\Program Data']] = None,
+        write_delay: float = settings_write_delay,
+        watch: bool = False
+    ):
         if os.name == 'nt':
             if location is None:
                 try:
@@ -47,38 +60,52 @@ class Settings:
             self.settings_path = pathlib.Path(location) / 'Beskar' / 'settings.json'
         else:
             self.settings_path = pathlib.Path('settings.json')
+
+        self.write_delay = write_delay
+
+        # NOTE: Reads only ever touch this dict, writes are batched
+        # up and saved once nothing has been set for write_delay seconds.
+        self.values = {}
+        self.lock = threading.RLock()
+        self.timer: Union[threading.Timer, None] = None
+        self.dirty = False
+        self.modified = None
+
         if self.settings_path.exists():
-            file_healthy = True
-            with self.settings_path.open() as file:
-                try:
-                    json.load(file)
-                except json.JSONDecodeError:
-                    file_healthy = False
-            if not file_healthy:
-                with self.settings_path.open(mode='w') as file:
-                    json.dump({}, file)
+            try:
+                self.values = self.read()
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                corrupt_path = self.settings_path.with_suffix('.json.corrupt')
+                os.replace(self.settings_path, corrupt_path)
+                logger.warning(
+                    f'The settings file was corrupt, it was moved to {corrupt_path} '
+                    'and the default settings are being used instead.'
+                )
+                self.save()
         else:
-            self.create()
+            self.save()
+
+        atexit.register(self.flush)
+
+        self.watcher = None
+        if watch:
+            self.watch()
 
         logger.info(f'Settings file path set to {self.settings_path}.')
 
     def __getitem__(self, key):
-        with self.check_or_create() as exists:
-            if exists:
-                with self.settings_path.open() as file:
-                    return json.load(file)[key]
-            else:
-                raise KeyError(key)
+        with self.lock:
+            return self.values[key]
 
     def __setitem__(self, key, value):
-        try:
-            with self.settings_path.open(mode='r') as file:
-                settings = json.load(file)
-        except FileNotFoundError:
-            settings = {}
-
-        settings[key] = value
-        self.create(settings, indent=4)
+        with self.lock:
+            self.values[key] = value
+            self.dirty = True
+            if self.timer is not None:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.write_delay, self.flush)
+            self.timer.daemon = True
+            self.timer.start()
         logger.info(f'Settings {key!r} has been set to {value}.')
 
     def get(self, key, default=None):
@@ -87,18 +114,75 @@ class Settings:
         except KeyError:
             return default
 
-    def create(self, dumping=None, indent=None):
-        if dumping is None:
-            dumping = {}
+    def read(self) -> dict:
+        with self.settings_path.open() as file:
+            values = json.load(file)
+        self.modified = self.settings_path.stat().st_mtime_ns
+        return values
+
+    def save(self):
+        # NOTE: Written to a temporary file first and then renamed over
+        # the settings file, so it is never left half written.
         if not self.settings_path.parent.exists():
             self.settings_path.parent.mkdir()
-        with self.settings_path.open(mode='w') as file:
-            json.dump(dumping, file, indent=indent)
+        with self.lock:
+            file = tempfile.NamedTemporaryFile(
+                mode='w',
+                dir=self.settings_path.parent,
+                prefix=f'.{self.settings_path.name}.',
+                suffix='.tmp',
+                delete=False
+            )
+            try:
+                with file:
+                    json.dump(self.values, file, indent=4)
+                    file.flush()
+                    os.fsync(file.fileno())
+                os.replace(file.name, self.settings_path)
+            except OSError:
+                with contextlib.suppress(OSError):
+                    os.remove(file.name)
+                raise
+            self.modified = self.settings_path.stat().st_mtime_ns
+            self.dirty = False
 
-    @contextmanager
-    def check_or_create(self):
-        try:
-            yield self.settings_path.exists()
-        finally:
-            if not self.settings_path.exists():
-                self.create()
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            if self.dirty:
+                try:
+                    self.save()
+                except OSError as error:
+                    logger.warning('Failed to save the settings.', exc_info=error)
+
+    def watch(self, interval: float = settings_watch_interval):
+        if self.watcher is None:
+            self.watcher = threading.Thread(
+                target=self.watch_file, args=(interval,), name='SettingsWatcher', daemon=True
+            )
+            self.watcher.start()
+
+    def watch_file(self, interval: float):
+        while True:
+            time.sleep(interval)
+            with self.lock:
+                if self.dirty:
+                    continue
+                try:
+                    modified = self.settings_path.stat().st_mtime_ns
+                except FileNotFoundError:
+                    logger.warning('The settings file was deleted, saving it again.')
+                    self.dirty = True
+                    self.flush()
+                    continue
+                if modified != self.modified:
+                    try:
+                        self.values = self.read()
+                        logger.info('Reloaded the settings after they were changed outside of Beskar.')
+                    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                        # NOTE: Could still be in the middle of being written,
+                        # the next change to it gets another chance.
+                        self.modified = modified
+                        logger.warning('Ignored an unreadable change to the settings file.')
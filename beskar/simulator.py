@@ -0,0 +1,260 @@
+from nidaqmx.constants import AcquisitionType, Edge, TaskMode
+from typing import List, NamedTuple, Tuple, Union
+from nidaqmx.error_codes import DAQmxErrors
+from .daq import SEALKitSession, sessions
+from nidaqmx.errors import DaqError
+from .timing import LEDStepScheduler
+from .utils import LED_position_gen
+from .constants import offset
+
+import threading
+import logging
+import numpy
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatorSettings(NamedTuple):
+    seed: int = 0
+    photocurrents: Union[numpy.ndarray, None] = None
+    dark_current: float = 0.3
+    drift: float = 0.05 # Volts the dark current wanders above and below its mean
+    drift_period: float = 600 # Seconds
+    noise: float = 0.01
+    latency: float = 0.002
+    accelerated: bool = False
+
+
+class VirtualClock:
+    def __init__(self, accelerated: bool = False):
+        self.accelerated = accelerated
+        self.skipped = threading.local()
+
+    def now(self) -> float:
+        return time.perf_counter() + getattr(self.skipped, 'seconds', 0)
+
+    def sleep(self, seconds: float):
+        if seconds <= 0:
+            return
+        if self.accelerated:
+            # NOTE: Each thread skips ahead on its own, so a thread that is
+            # sleeping never makes the time pass faster for another thread.
+            self.skipped.seconds = getattr(self.skipped, 'seconds', 0) + seconds
+        else:
+            time.sleep(seconds)
+
+
+class SimulatedSEALKit:
+    def __init__(self, settings: SimulatorSettings = SimulatorSettings()):
+        self.settings = settings
+
+        self.clock = VirtualClock(settings.accelerated)
+
+        self.rng = numpy.random.default_rng(settings.seed)
+        if settings.photocurrents is None:
+            self.photocurrents = self.rng.uniform(0.2, 1, (8, 8))
+        else:
+            self.photocurrents = numpy.asarray(settings.photocurrents, dtype=float)
+
+        # NOTE: The drift is a slow wave instead of a ramp so a kit that is
+        # simulated for hours never strays into an unusually high dark current.
+        self.drift_phase = self.rng.uniform(0, 2 * numpy.pi)
+
+        self.voltage = offset
+        self.LEDs_on = False
+
+        self.led_position_gen = LED_position_gen(start_at_zero=True)
+        self.first_sequence = True
+        self.positions: List[Tuple[int, int]] = []
+        self.offsets = numpy.zeros(0)
+        self.flashed_at = None
+
+        self.origin = self.clock.now()
+
+        self.lock = threading.Lock()
+
+    def write_voltage(self, voltage: float):
+        self.clock.sleep(self.settings.latency)
+        self.voltage = voltage
+
+    def write_LEDs(self, off: bool):
+        self.clock.sleep(self.settings.latency)
+        if not off:
+            # NOTE: Like the real SEAL kit every flash sequence picks up
+            # where the last one left off, only the first one is shorter.
+            steps = 64 if self.first_sequence else 65
+            self.first_sequence = False
+            self.positions = [next(self.led_position_gen)[:2] for _ in range(steps)]
+            self.offsets = LEDStepScheduler(steps).offsets
+            self.flashed_at = self.clock.now()
+        self.LEDs_on = not off
+
+    def flash_time(self, step: int) -> Union[float, None]:
+        if self.flashed_at is None or step >= len(self.offsets):
+            return None
+        return self.flashed_at + self.offsets[step]
+
+    def photocurrent(self, at: float) -> float:
+        if self.flashed_at is None:
+            return 0
+        step = numpy.searchsorted(self.offsets, at - self.flashed_at, side='right') - 1
+        if step < 0 or step >= len(self.positions):
+            return 0
+        return self.photocurrents[self.positions[step]]
+
+    def drift(self, at: numpy.ndarray) -> numpy.ndarray:
+        return self.settings.drift * numpy.sin(
+            2 * numpy.pi * (at - self.origin) / self.settings.drift_period + self.drift_phase
+        )
+
+    def sample(self, start: float, samples: int, sample_rate: float, out: numpy.ndarray = None) -> numpy.ndarray:
+        if out is None:
+            out = numpy.empty(samples)
+        times = start + numpy.arange(samples) / sample_rate
+        with self.lock:
+            out[:] = self.rng.normal(0, self.settings.noise, samples)
+        out += self.settings.dark_current + self.drift(times)
+        out += self.photocurrent(start)
+        return out
+
+
+class SimulatedTask:
+    def __init__(self, kit: SimulatedSEALKit):
+        self.kit = kit
+
+        self.channel = None
+
+        # NOTE: Stands in for the handful of nidaqmx.Task
+        # attributes that the session actually uses.
+        self.ao_channels = self.do_channels = self.ai_channels = self
+        self.timing = self.triggers = self.start_trigger = self.in_stream = self
+
+        self.sample_rate = None
+        self.sample_mode = None
+        self.samples_per_channel = None
+        self.trigger_source = None
+        self.retriggerable = False
+        self.input_buf_size = None
+
+        self.started_at = None
+        self.samples_read = 0
+        self.triggers_read = 0
+
+    def __enter__(self) -> 'SimulatedTask':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_ao_voltage_chan(self, physical_channel: str, min_val: float = -10, max_val: float = 10):
+        self.channel = 'ao'
+
+    def add_do_chan(self, lines: str):
+        self.channel = 'do'
+
+    def add_ai_voltage_chan(self, physical_channel: str, min_val: float = -10, max_val: float = 10):
+        self.channel = 'ai'
+
+    def cfg_samp_clk_timing(
+        self,
+        rate: float,
+        sample_mode: AcquisitionType = AcquisitionType.FINITE,
+        samps_per_chan: int = 1000
+    ):
+        self.sample_rate = rate
+        self.sample_mode = sample_mode
+        self.samples_per_channel = samps_per_chan
+
+    def cfg_dig_edge_start_trig(self, trigger_source: str, trigger_edge: Edge = Edge.RISING):
+        self.trigger_source = trigger_source
+
+    def control(self, action: TaskMode):
+        pass
+
+    def start(self):
+        self.started_at = self.kit.clock.now() + self.kit.settings.latency
+        self.samples_read = 0
+        self.triggers_read = 0
+
+    def stop(self):
+        self.started_at = None
+
+    def close(self):
+        self.started_at = None
+
+    def write(self, data: Union[float, bool]):
+        if self.channel == 'ao':
+            self.kit.write_voltage(data)
+        elif self.channel == 'do':
+            self.kit.write_LEDs(data)
+
+    def acquire(self, samples: int, timeout: float, out: numpy.ndarray = None) -> numpy.ndarray:
+        clock = self.kit.clock
+        if self.sample_mode is None:
+            clock.sleep(self.kit.settings.latency)
+            return self.kit.sample(clock.now(), samples, 1000, out)
+
+        if self.trigger_source is not None:
+            start = self.kit.flash_time(self.triggers_read)
+            if start is None or start + samples / self.sample_rate - clock.now() > timeout:
+                clock.sleep(timeout)
+                raise DaqError(
+                    'Some or all of the samples requested have not yet been acquired.',
+                    DAQmxErrors.SAMPLES_NOT_YET_AVAILABLE.value
+                )
+            self.triggers_read += 1
+        else:
+            start = self.started_at + self.samples_read / self.sample_rate
+            self.samples_read += samples
+
+        remaining = start + samples / self.sample_rate - clock.now()
+        if self.sample_mode == AcquisitionType.CONTINUOUS:
+            # NOTE: The dark current is always streamed in real time,
+            # otherwise an accelerated clock would make the monitor spin.
+            time.sleep(max(remaining, 0))
+        else:
+            clock.sleep(remaining)
+
+        return self.kit.sample(start, samples, self.sample_rate, out)
+
+    def read(self, number_of_samples_per_channel: int = 1, timeout: float = 10) -> List[float]:
+        return self.acquire(number_of_samples_per_channel, timeout).tolist()
+
+    def read_many_sample(
+        self,
+        data: numpy.ndarray,
+        number_of_samples_per_channel: int,
+        timeout: float = 10
+    ) -> int:
+        self.acquire(number_of_samples_per_channel, timeout, data[:number_of_samples_per_channel])
+        return number_of_samples_per_channel
+
+
+class SimulatedSEALKitSession(SEALKitSession):
+    def __init__(self, device_name: Union[str, None], settings: SimulatorSettings = SimulatorSettings()):
+        super().__init__(device_name)
+
+        self.kit = SimulatedSEALKit(settings)
+
+        self.clock = self.kit.clock.now
+        self.sleep = self.kit.clock.sleep
+
+    def create_task(self) -> SimulatedTask:
+        return SimulatedTask(self.kit)
+
+    def create_reader(self, task: SimulatedTask) -> SimulatedTask:
+        return task
+
+
+def simulate(
+    device_name: Union[str, None],
+    settings: SimulatorSettings = SimulatorSettings()
+) -> SimulatedSEALKitSession:
+    if device_name in sessions:
+        sessions[device_name].close()
+    sessions[device_name] = SimulatedSEALKitSession(device_name, settings)
+
+    logger.info(f'Simulating the SEAL kit {device_name} with {settings}.')
+
+    return sessions[device_name]
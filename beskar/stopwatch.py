@@ -0,0 +1,52 @@
+from typing import Dict, List, Tuple
+
+import datetime
+import pathlib
+import logging
+import json
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class Stopwatch:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.last = self.started
+        self.laps: List[Tuple[str, float]] = []
+
+    def lap(self, name: str):
+        now = time.perf_counter()
+        self.laps.append((name, now - self.last))
+        self.last = now
+
+    @property
+    def total(self) -> float:
+        return self.last - self.started
+
+    def summary(self) -> Dict[str, float]:
+        summary = {name: round(duration * 1000, 3) for name, duration in self.laps}
+        summary['total'] = round(self.total * 1000, 3)
+        return summary
+
+    def __str__(self) -> str:
+        return ', '.join(f'{name} {duration:.1f} ms' for name, duration in self.summary().items())
+
+    def log(self):
+        logger.info(f'Startup took {self}.')
+
+    def save(self, path: pathlib.Path, version: str):
+        # NOTE: One line per launch, so startup times can be compared across releases.
+        try:
+            with path.open(mode='a') as file:
+                file.write(json.dumps({
+                    'version': version,
+                    'launched': f'{datetime.datetime.now():%Y-%m-%d %H:%M:%S}',
+                    'milliseconds': self.summary()
+                }) + '\n')
+        except OSError as error:
+            logger.warning('Failed to save the startup time.', exc_info=error)
+
+# NOTE: Imported before anything else in beskar so
+# the startup breakdown covers every import after it.
+startup_time = Stopwatch()
@@ -0,0 +1,163 @@
+from typing import Callable, Dict, Generator, Tuple
+from .constants import LED_cadence, max_trace_files
+from contextlib import contextmanager
+
+import logging
+import pathlib
+import numpy
+import time
+import csv
+
+logger = logging.getLogger(__name__)
+
+
+class JitterReport:
+    def __init__(self, lateness: numpy.ndarray, step_length: float = LED_cadence[-1]):
+        self.lateness = lateness
+        self.step_length = step_length
+
+    def __len__(self) -> int:
+        return len(self.lateness)
+
+    @property
+    def missed_steps(self) -> numpy.ndarray:
+        # NOTE: Once a reading is half a step late it
+        # is closer to the next LED than the one it was for.
+        return numpy.flatnonzero(self.lateness > self.step_length / 2)
+
+    def summary(self) -> Dict[str, float]:
+        if len(self) == 0:
+            return {'steps': 0}
+        milliseconds = self.lateness * 1000
+        p50, p95, p99 = numpy.percentile(milliseconds, (50, 95, 99))
+        return {
+            'steps': len(self),
+            'mean_ms': float(milliseconds.mean()),
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'p99_ms': float(p99),
+            'max_ms': float(milliseconds.max()),
+            'missed_steps': len(self.missed_steps)
+        }
+
+    def __str__(self) -> str:
+        summary = self.summary()
+        if summary['steps'] == 0:
+            return 'no steps recorded'
+        return (
+            f"{summary['steps']} steps, lateness p50 {summary['p50_ms']:.2f} ms, "
+            f"p95 {summary['p95_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms, "
+            f"max {summary['max_ms']:.2f} ms, {summary['missed_steps']} missed"
+        )
+
+
+class LEDStepScheduler:
+    def __init__(
+        self,
+        steps: int,
+        cadence: Tuple[float, ...] = LED_cadence,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+        hardware_triggered: bool = False
+    ):
+        self.clock = clock
+        self.sleep = sleep
+
+        self.hardware_triggered = hardware_triggered
+
+        self.step_length = cadence[-1]
+
+        # NOTE: Offsets are measured from the start of the LED flashes,
+        # so a late step never pushes back the steps that come after it.
+        intervals = numpy.full(steps, cadence[-1])
+        leading = min(steps, len(cadence) - 1)
+        intervals[:leading] = cadence[:leading]
+        self.offsets = numpy.cumsum(intervals)
+
+        self.lateness = numpy.zeros(steps)
+        self.recorded = 0
+
+        self.anchor = None
+
+    def start(self, anchor: float = None):
+        self.anchor = self.clock() if anchor is None else anchor
+        self.recorded = 0
+
+    def deadline(self, step: int) -> float:
+        if self.anchor is None:
+            raise RuntimeError('start() must be called before any deadlines can be computed.')
+        return self.anchor + self.offsets[step]
+
+    def wait_for_step(self, step: int) -> float:
+        remaining = self.deadline(step) - self.clock()
+        if remaining > 0:
+            self.sleep(remaining)
+        return self.record(step)
+
+    def record(self, step: int) -> float:
+        lateness = self.clock() - self.deadline(step)
+        self.lateness[step] = lateness
+        self.recorded = max(self.recorded, step + 1)
+
+        # NOTE: A hardware triggered reading always lines up with its LED
+        # no matter how late it is read, so only the lateness is kept.
+        if lateness > self.step_length / 2 and not self.hardware_triggered:
+            logger.warning(
+                f'Step {step + 1} was {lateness * 1000:.0f} ms late, '
+                'the reading may belong to the wrong LED.'
+            )
+
+        return lateness
+
+    def report(self) -> JitterReport:
+        return JitterReport(self.lateness[:self.recorded].copy(), self.step_length)
+
+
+class ScanTrace:
+    stages = ('sleep', 'acquire', 'reduce', 'emit')
+
+    def __init__(self, steps: int, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+
+        self.positions = numpy.full((steps, 2), -1)
+        self.started = numpy.zeros(steps)
+        self.durations = numpy.zeros((steps, len(self.stages)))
+
+        self.anchor = self.clock()
+
+    @contextmanager
+    def span(self, step: int, stage: str) -> Generator[None, None, None]:
+        start = self.clock()
+        if stage == self.stages[0] or not self.started[step]:
+            self.started[step] = start - self.anchor
+        try:
+            yield
+        finally:
+            self.durations[step, self.stages.index(stage)] = self.clock() - start
+
+    def set_position(self, step: int, position: Tuple[int, ...]):
+        self.positions[step] = position[:2]
+
+    def busy(self, step: int) -> float:
+        # NOTE: Everything but the sleep counts against the step's budget.
+        return float(self.durations[step, 1:].sum())
+
+    def save(self, path: pathlib.Path):
+        with path.open(mode='w', newline='') as file:
+            writer = csv.writer(file, csv.excel)
+            writer.writerow(
+                ['step', 'row', 'column', 'started_ms']
+                + [f'{stage}_ms' for stage in self.stages]
+            )
+            for step, ((row, column), started, durations) in enumerate(
+                zip(self.positions, self.started * 1000, self.durations * 1000)
+            ):
+                writer.writerow(
+                    [step + 1, row + 1, column + 1, f'{started:.3f}']
+                    + [f'{duration:.3f}' for duration in durations]
+                )
+
+        # NOTE: Only the most recent traces are kept around.
+        traces = sorted(path.parent.glob('*.csv'), key=lambda trace: trace.stat().st_mtime)
+        for trace in traces[:-max_trace_files]:
+            trace.unlink()
@@ -1,26 +1,30 @@
-from typing import Callable, Generator, Tuple, Union, Literal, Any, List
-from PyQt6.QtDataVisualization import QBarDataItem
-from nidaqmx._lib import DaqNotFoundError
+from typing import TYPE_CHECKING, Generator, Tuple, Union, List, Dict
 from contextlib import contextmanager
-from PyQt6.QtCore import QMetaObject
-from nidaqmx.system import System
+from PyQt6.QtCore import QMetaObject, QThread
 from .constants import offset
 
-import itertools
+import importlib
 import logging
 import pathlib
-import nidaqmx
-import numpy
+import time
+import sys
+import os
 import re
 
+if TYPE_CHECKING:
+    from .daq import SEALKitSession
+
 logger = logging.getLogger(__name__)
 
-def apply_voltage(device_name: str, voltage: Union[float, int] = offset):
-    with nidaqmx.Task() as task:
-        task.ao_channels.add_ao_voltage_chan(f'{device_name}/ao0', min_val=0, max_val=5)
-        task.write(voltage)
+def get_session(device_name: str) -> 'SEALKitSession':
+    # NOTE: nidaqmx is slow to import, so .daq is only
+    # imported once something actually talks to a SEAL kit.
+    from .daq import get_session
+
+    return get_session(device_name)
 
-    logger.info(f'{voltage} has been applied to the SEAL kit.')
+def apply_voltage(device_name: str, voltage: Union[float, int] = offset):
+    get_session(device_name).apply_voltage(voltage)
 
 def LED_position_gen(start_at_zero: bool = False) -> Generator[Union[Tuple[int, int], Tuple[int, int, None]], None, None]:
     offset = 1 if start_at_zero else 0
@@ -42,53 +46,72 @@ def LED_position_gen(start_at_zero: bool = False) -> Generator[Union[Tuple[int,
             for row in row_pattern:
                 yield (row - offset, column - offset)
 
-def interact_with_LEDs(device_name: str, interaction: Literal['on', 'off', 'on&off']):
-    if interaction not in {'on', 'off', 'on&off'}:
-        raise ValueError(f"interaction must be 'on', 'off', or 'on&off', not '{interaction}'")
-
-    logger.info(f'The LEDs in the SEAL kit were turned {interaction}.')
-
-    with nidaqmx.Task() as task:
-        task.do_channels.add_do_chan(f'{device_name}/port0/line0')
-        if interaction == 'on':
-            task.write(False)
-        elif interaction == 'off':
-            task.write(True)
-        elif interaction == 'on&off':
-            task.write(False)
-            task.write(True)
-
-def get_number_of_devices(system=True, drivers=False):
-    errors  = (FileNotFoundError, DaqNotFoundError)
-    has_drivers = True
-    try:
-        from __main__ import PyInstallerImportError
-        errors += (PyInstallerImportError,)
-    except ImportError:
-        pass
-    the_system = System.local()
-    try:
-        num_of_devices = len(the_system.devices)
-    except errors:
-        num_of_devices = 0
-        has_drivers = False
-    if system and drivers:
-        return the_system, num_of_devices, has_drivers
-    elif system:
-        return the_system, num_of_devices
-    elif drivers:
-        return has_drivers, num_of_devices
-    else:
-        return num_of_devices
+class AssetIndex:
+    directories = ('images', 'desc', 'qss', 'fonts')
+
+    def __init__(self):
+        self.paths: Dict[Tuple[str, str], pathlib.Path] = {}
+        self.build_time: Union[float, None] = None
+
+    def roots(self) -> List[pathlib.Path]:
+        # NOTE: PyInstaller puts the assets next to the executable (or in
+        # _MEIPASS), from source they live next to this file. The working
+        # directory is last since that is where the old glob looked.
+        roots = []
+        if getattr(sys, 'frozen', False):
+            roots.append(pathlib.Path(getattr(sys, '_MEIPASS', pathlib.Path(sys.executable).parent)))
+        roots.append(pathlib.Path(__file__).parent)
+        roots.append(pathlib.Path('.'))
+        return roots
+
+    def build(self):
+        start = time.perf_counter()
+
+        # NOTE: Only the asset folders are walked, never the whole program folder.
+        for directory in self.directories:
+            for root in self.roots():
+                folder = root / directory
+                if not folder.is_dir():
+                    continue
+                for dir_path, _, file_names in os.walk(folder):
+                    for file_name in file_names:
+                        asset = pathlib.Path(dir_path) / file_name
+                        self.paths.setdefault(
+                            (directory, asset.relative_to(folder).as_posix()), asset
+                        )
+                break
+
+        self.build_time = time.perf_counter() - start
+
+    def get(self, file_path: str, directory: str) -> Union[pathlib.Path, None]:
+        if self.build_time is None:
+            self.build()
+        return self.paths.get((directory, file_path))
+
+    def frames(self, folder: str, directory: str = 'images') -> List[pathlib.Path]:
+        if self.build_time is None:
+            self.build()
+        frames = [
+            path for (asset_directory, name), path in self.paths.items()
+            if asset_directory == directory and name.startswith(f'{folder}/')
+        ]
+        frame_number = re.compile(r'\d+')
+        return sorted(frames, key=lambda path: int(frame_number.search(path.name)[0]))
+
+    def log_build_time(self):
+        if self.build_time is not None:
+            logger.info(f'Indexed {len(self.paths)} assets in {self.build_time * 1000:.2f} ms.')
+
+assets = AssetIndex()
 
 def get_file(file_path: str, dir='images', path=False) -> Union[pathlib.Path, str, None]:
-    try:
-        icon_path = next(pathlib.Path('.').glob(f'**/{dir}/{file_path}'))
+    icon_path = assets.get(file_path, dir)
+    if icon_path is not None:
         if path:
             return icon_path
         else:
             return str(icon_path)
-    except StopIteration:
+    else:
         # If this happens, somehow the icon was deleted from the install folder
         # TODO: Connect to internet and reinstall missing asset
         # NOTE: Reinstalling missing asset is more difficult that initially
@@ -97,65 +120,24 @@ def get_file(file_path: str, dir='images', path=False) -> Union[pathlib.Path, st
         # the assets in non escalated privileges folder such as %appdata%
         logger.warning(f'{file_path} was not detected, may be fatal.')
 
-def get_folder(folder: Union[str, pathlib.Path], path: bool = True):
-    if isinstance(folder, str):
-        folder = pathlib.Path(folder)
-
-    if not folder.exists():
-        folder = pathlib.Path('beskar') / folder
-
-    if folder.exists():
-        if path:
-            return folder
-        else:
-            return str(folder)
-
-    logger.warning(f'{folder} could not be found, may be fatal.')
-
-def sort_frames(
-    folder: pathlib.Path,
-    glob: str, key: Callable[[pathlib.Path], Any] = None,
-    cycler: bool = True
-):
-    if key is None:
-        frame_number = re.compile(r'\d+')
-        key = lambda path: int(frame_number.search(path.name)[0])
-
-    sorted_frames = sorted(folder.glob(glob), key=key)
-    if cycler:
-        return itertools.cycle(sorted_frames)
-    else:
-        return sorted_frames
-
 def error_to_exc_tuple(error: Exception):
     return (type(error), error, error.__traceback__)
 
 
-class TwoDQBarDataItem(numpy.ndarray):
-    def tolist(self, convert_to_bar_data=False) -> Union[List[List[QBarDataItem]], List[List[int]]]:
-        if convert_to_bar_data:
-            return [list(
-                map(lambda item: QBarDataItem(item), listt)
-            ) for listt in super().tolist()]
-        else:
-            return super().tolist()
-
-    def __setitem__(self, key, value) -> None:
-        current_value = self[key]
-        if not hasattr(self, 'last_values_written'):
-            self.last_values_written = []
-        if current_value != 0:
-            value = (current_value + value) / 2
-        self.last_values_written.append(value)
-
-        super().__setitem__(key, value)
+class BackgroundImport(QThread):
+    def __init__(self, *modules: str):
+        super().__init__()
 
-    def last_values_zero(self):
-        if not hasattr(self, 'last_values_written'):
-            self.last_values_written = []
+        self.modules = modules
 
-        return (all(map(lambda item: item == 0, self.last_values_written[-4:]))
-                and len(self.last_values_written[-4:]) >= 4)
+    def run(self):
+        start = time.perf_counter()
+        for module in self.modules:
+            importlib.import_module(module)
+        logger.info(
+            f'Imported {", ".join(self.modules)} in the background '
+            f'in {(time.perf_counter() - start) * 1000:.1f} ms.'
+        )
 
 
 class BaseInteractable:
@@ -1,11 +1,10 @@
-from .utils import get_file, get_folder, sort_frames
+from .animation import FrameAnimator, frame_pixmaps, render_svg
 from PyQt6 import QtWidgets, QtCore, QtGui, QtSvg
+from .utils import get_file, assets
 from typing import Literal, Union
 from .settings import logging_dir
 from .logs import setUpLogger
 
-import itertools
-
 logger = setUpLogger(__name__, logging_dir)
 
 
@@ -92,7 +91,7 @@ class StepProgressBar(QtWidgets.QWidget):
         self,
         steps: Literal[2, 3, 4],
         *args,
-        checkmark_icon_dir_str: str = 'images/checkmark-frames',
+        checkmark_icon_frames: str = 'checkmark-frames',
         **kwargs
     ):
         if steps not in {2, 3, 4}:
@@ -123,11 +122,8 @@ class StepProgressBar(QtWidgets.QWidget):
             else:
                 logger.warning('Failed to load Inter-Light.ttf')
 
-        checkmark_icon_dir = get_folder(checkmark_icon_dir_str)
-        self.checkmark_animated = bool(checkmark_icon_dir)
-        if self.checkmark_animated:
-            self.frames = sort_frames(checkmark_icon_dir, '*.svg')
-            self.counter = itertools.cycle(range(8))
+        self.checkmark_icon_frames = checkmark_icon_frames
+        self.checkmark_animated = bool(assets.frames(checkmark_icon_frames))
 
         self.checkmark_icon = get_file('checkmark-icon.svg')
 
@@ -139,9 +135,11 @@ class StepProgressBar(QtWidgets.QWidget):
         self.bubble_height = 15
         self.bubble_width = 15
 
-        self.timer = QtCore.QTimer()
-        self.timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
-        self.timer.timeout.connect(self.repaint)
+        self.checkmark_animator = FrameAnimator(
+            len(assets.frames(checkmark_icon_frames)), 40, self
+        )
+        self.checkmark_animator.frame_changed.connect(lambda frame: self.update())
+        self.checkmark_animator.finished.connect(self.finish_step)
 
         self.pen = QtGui.QPen(QtGui.QColorConstants.White, 1)
 
@@ -153,15 +151,27 @@ class StepProgressBar(QtWidgets.QWidget):
     def sizeHint(self) -> QtCore.QSize:
         return QtCore.QSize(100, self.bubble_height * 2 + 2)
 
+    def set_total_steps(self, steps: Literal[2, 3, 4]):
+        if steps not in {2, 3, 4}:
+            raise TypeError(
+                f"StepProgressBar only supports 2, 3, and 4 steps, not '{steps}'"
+            )
+        self.total_steps = steps
+        self.update()
+
     def set_step(self, step: int):
-        if self.current_step + 1 == step:
-            self.timer.start(40)
+        if self.current_step + 1 == step and self.checkmark_animated:
+            self.checkmark_animator.start()
         else:
-            if self.timer.isActive():
-                self.timer.stop()
+            self.checkmark_animator.stop()
             self.current_step = step
             self.update()
 
+    @QtCore.pyqtSlot()
+    def finish_step(self):
+        self.current_step += 1
+        self.update()
+
     def paintEvent(self, paint_event: QtGui.QPaintEvent):
         painter = QtGui.QPainter()
         painter.begin(self)
@@ -220,7 +230,7 @@ class StepProgressBar(QtWidgets.QWidget):
         number: Union[str, int],
         center_y: int = None,
     ):
-        svg_renderer = None
+        pixmap = None
 
         if center_y is None:
             center_y = self.bubble_y
@@ -234,28 +244,32 @@ class StepProgressBar(QtWidgets.QWidget):
             self.bubble_height
         )
 
+        # NOTE: The checkmarks are rasterized once per size and device
+        # pixel ratio, after that painting them is just copying pixmaps.
+        size = self.font_size * 2
+        device_pixel_ratio = self.devicePixelRatioF()
+
         if number < self.current_step and self.checkmark_icon:
-            svg_renderer = QtSvg.QSvgRenderer(self.checkmark_icon)
-
-        if number == self.current_step and self.checkmark_animated and self.timer.isActive():
-            frame, counter  = next(self.frames), next(self.counter)
-            svg_renderer = QtSvg.QSvgRenderer(str(frame))
-            if counter == 7:
-                self.timer.stop()
-                self.current_step += 1
-
-        if svg_renderer:
-            svg_renderer.setAspectRatioMode(QtCore.Qt.AspectRatioMode.KeepAspectRatio)
-            svg_renderer.render(
-                painter,
+            pixmap = render_svg(self.checkmark_icon, size, size, device_pixel_ratio)
+
+        # NOTE: The animator only has a frame once its timer has ticked.
+        if number == self.current_step and self.checkmark_animator.frame is not None:
+            pixmap = frame_pixmaps(
+                self.checkmark_icon_frames, size, size, device_pixel_ratio
+            )[self.checkmark_animator.frame]
+
+        if pixmap is not None:
+            painter.drawPixmap(
                 QtCore.QRectF(
                     # NOTE: Not sure if this pattern holds with variable font sizes.
                     # Only tested with self.font_size=18
                     center_x - self.bubble_width + self.font_size - 1,
                     self.bubble_y - self.bubble_height + self.font_size - 1,
-                    self.font_size * 2,
-                    self.font_size * 2
-                )
+                    size,
+                    size
+                ),
+                pixmap,
+                QtCore.QRectF(pixmap.rect())
             )
         else:
             painter.drawText(
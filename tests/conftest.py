@@ -0,0 +1,12 @@
+import tempfile
+import pathlib
+import sys
+import os
+
+# NOTE: Has to be set before beskar creates the QApplication.
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# NOTE: From source beskar keeps its settings and logs in the working
+# directory, so the tests run somewhere they can not touch the real ones.
+sys.path.insert(0, str(pathlib.Path(__file__).parents[1]))
+os.chdir(tempfile.mkdtemp(prefix='beskar-tests-'))
@@ -0,0 +1,36 @@
+from beskar.simulator import SimulatorSettings, simulate
+
+import threading
+
+
+def test_AO_and_DO_writes_do_not_wait_for_a_continuous_AI_task():
+    session = simulate('Dev1', SimulatorSettings(accelerated=True))
+
+    streaming = threading.Event()
+    stop_streaming = threading.Event()
+
+    def stream():
+        with session.continuous_AI_task():
+            streaming.set()
+            stop_streaming.wait(timeout=10)
+
+    def write():
+        session.apply_voltage(1.5)
+        session.interact_with_LEDs('on&off')
+
+    streamer = threading.Thread(target=stream, daemon=True)
+    streamer.start()
+    try:
+        assert streaming.wait(timeout=5)
+
+        writer = threading.Thread(target=write, daemon=True)
+        writer.start()
+        writer.join(timeout=3)
+
+        assert not writer.is_alive()
+        assert session.kit.voltage == 1.5
+        assert not session.kit.LEDs_on
+    finally:
+        stop_streaming.set()
+        streamer.join()
+        session.close()